@@ -10,6 +10,13 @@ setup(
         "numpy>=2.2",
         "prettytable>=3.15"
     ],
+    extras_require={
+        "fast": ["orjson>=3.9"],
+        "stream": ["ijson>=3.1"],
+        "inotify": ["inotify_simple>=1.3"],
+        "sound": ["simpleaudio>=1.0"],
+        "jit": ["numba>=0.61"],
+    },
     author="Simone Tollardo",
     author_email="tollsimy.dev@protonmail.com",
     description="Reliability Analysis and Precision Injection Diagnostic",
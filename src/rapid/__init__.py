@@ -1,11 +1,26 @@
-from .analyzer import ResultsAnalyzer
-from .visualizer import ResultsVisualizer
-from .injecter import FaultInjecter
+import importlib
+
 from .parser import ResultsParser
-from .sql_converter import ResultsDBConverter
-from .utils.candaguardia import CanDaGuardia
 from .benchmark_classifier import BenchmarkClassifierInterface
 
+# Heavy modules (matplotlib, sqlite, prettytable) are only imported on first
+# attribute access so that e.g. `--monitor` or `--inject` start up quickly.
+_LAZY_IMPORTS = {
+    'ResultsAnalyzer': '.analyzer',
+    'ResultsVisualizer': '.visualizer',
+    'FaultInjecter': '.injecter',
+    'ResultsDBConverter': '.sql_converter',
+    'CanDaGuardia': '.utils.candaguardia',
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     'ResultsAnalyzer',
     'ResultsVisualizer', 
@@ -2,11 +2,17 @@ import json
 import sys
 import os
 import sqlite3
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 from prettytable import PrettyTable
 from typing import Dict, Any, List
 
 
+BenchmarkStats = namedtuple(
+    'BenchmarkStats',
+    ['status_counts', 'test_coverage', 'bit_position_stats', 'hierarchy_counts']
+)
+
+
 class ResultsAnalyzer:
     STATUS_COLORS = {
         'passed': '#2ecc71',     # Green
@@ -156,6 +162,10 @@ class ResultsAnalyzer:
             except ValueError:
                 return f"Reserved ({cause})"
         
+        # Registers of 2**63 and above are stored as negative 64-bit integers
+        if isinstance(cause, int) and cause < 0:
+            cause &= 0xFFFFFFFFFFFFFFFF
+        
         # u74mc sepc
         causes = {
             0x0: "Instruction address misaligned",
@@ -334,6 +344,94 @@ class ResultsAnalyzer:
         ''', (self.benchmark_name,))
         counts["failed"]["clean"] = cursor.fetchone()[0]
         
+    def compute_all_stats(self) -> BenchmarkStats:
+        """Compute status, coverage, bit position and hierarchy counts in a single scan
+        
+        Returns the same values as count_by_status(), analyze_test_coverage(),
+        analyze_by_bit_position() and get_status_hierarchy_counts(), but derives
+        them from one grouped query instead of one query per counter.
+        """
+        if not self._check_benchmark():
+            return BenchmarkStats({}, {}, {}, {})
+        
+        cursor = self._execute_query('''
+            SELECT s.class, s.SDC, t.bit_position,
+                   t.output IS NOT NULL, t.needs_manual_check = 1,
+                   tr.test_id IS NOT NULL, h.test_id IS NOT NULL,
+                   c.test_id IS NOT NULL, hr.test_id IS NOT NULL,
+                   e.test_id IS NOT NULL, COUNT(*)
+            FROM tests t
+            LEFT JOIN status s ON t.test_id = s.test_id
+            LEFT JOIN traps tr ON t.test_id = tr.test_id
+            LEFT JOIN halts h ON t.test_id = h.test_id
+            LEFT JOIN comm_failure c ON t.test_id = c.test_id
+            LEFT JOIN hw_resets hr ON t.test_id = hr.test_id
+            LEFT JOIN exec_failure e ON t.test_id = e.test_id
+            WHERE t.benchmark = ?
+            GROUP BY 1, 2, 3, 4, 5, 6, 7, 8, 9, 10
+        ''', (self.benchmark_name,))
+        
+        status_counts = {
+            "passed": 0, "failed": 0, "trap": 0, "halt": 0, "outlier": 0,
+            "SDC": 0, "hw-reset": 0, "comm_failure": 0, "exec_failure": 0
+        }
+        coverage = {"total_tests": 0, "with_output": 0, "needs_manual_check": 0}
+        bit_position_stats = {
+            "passed": defaultdict(int),
+            "failed": defaultdict(int),
+            "trap": defaultdict(int),
+            "halt": defaultdict(int)
+        }
+        counts = {
+            "passed": {"clean": 0, "trap": 0, "SDC": 0, "halt": 0, "comm_failure": 0, "total": 0},
+            "failed": {"clean": 0, "trap": 0, "SDC": 0, "halt": 0, "comm_failure": 0, "exec_failure": 0, "total": 0},
+            "outlier": {"trap": 0, "SDC": 0, "halt": 0, "comm_failure": 0, "total": 0}
+        }
+        
+        for (status, sdc, bit_pos, has_output, manual_check,
+             trap, halt, comm_failure, hw_reset, exec_failure, n) in cursor.fetchall():
+            coverage["total_tests"] += n
+            coverage["with_output"] += n if has_output else 0
+            coverage["needs_manual_check"] += n if manual_check else 0
+            
+            if status in status_counts:
+                status_counts[status] += n
+            status_counts["SDC"] += n if sdc == 1 else 0
+            status_counts["trap"] += n if trap else 0
+            status_counts["halt"] += n if halt else 0
+            status_counts["hw-reset"] += n if hw_reset else 0
+            status_counts["comm_failure"] += n if comm_failure else 0
+            status_counts["exec_failure"] += n if exec_failure else 0
+            
+            if bit_pos is not None:
+                if status in ("passed", "failed"):
+                    bit_position_stats[status][bit_pos] += n
+                if trap:
+                    bit_position_stats["trap"][bit_pos] += n
+                if halt:
+                    bit_position_stats["halt"][bit_pos] += n
+            
+            if status not in counts:
+                continue
+            category = counts[status]
+            category["total"] += n
+            category["trap"] += n if trap else 0
+            category["halt"] += n if halt else 0
+            category["comm_failure"] += n if comm_failure else 0
+            category["SDC"] += n if sdc == 1 else 0
+            if status == "failed":
+                category["exec_failure"] += n if exec_failure else 0
+            
+            no_events = not (trap or halt or comm_failure or hw_reset)
+            if status == "passed" and sdc == 0 and no_events:
+                category["clean"] += n
+            elif status == "failed" and no_events and not exec_failure:
+                category["clean"] += n
+        
+        status_counts["total"] = coverage["total_tests"]
+        
+        return BenchmarkStats(status_counts, coverage, bit_position_stats, counts)
+    
     def find_tests_with_status(self, status_name: str) -> List[str]:
         """Find all tests with a specific status"""
         if not self._check_benchmark():
@@ -361,15 +459,18 @@ class ResultsAnalyzer:
             
         return [row[0] for row in cursor.fetchall()]
     
-    def print_summary(self):
-        """Print summary of results with detailed hierarchical tables"""
+    def print_summary(self, stats: BenchmarkStats = None):
+        """Print summary of results with detailed hierarchical tables
+        
+        Pass stats already returned by compute_all_stats() to avoid scanning the benchmark again.
+        """
         if not self._check_benchmark():
             return
             
-        status_counts = self.count_by_status()
-        coverage = self.analyze_test_coverage()
-        counts = self.get_status_hierarchy_counts()
-        total_tests = coverage["total_tests"]
+        if stats is None:
+            stats = self.compute_all_stats()
+        counts = stats.hierarchy_counts
+        total_tests = stats.test_coverage["total_tests"]
         
         self.print_status_verification_table()
         self._print_strict_failures_table(counts, total_tests)
@@ -11,11 +11,73 @@ import os
 import sys
 from typing import List
 from .parser import ResultsParser, NoSuitableClassifierError
-from .sql_converter import ResultsDBConverter
-from .analyzer import ResultsAnalyzer  
-from .visualizer import ResultsVisualizer
-from .injecter import FaultInjecter
-from .utils.candaguardia import CanDaGuardia
+
+# Pattern variables that a log_format.py file may define
+_PATTERN_VARS = ('TEST_NUMBER_PATTERN', 'TEST_BLOCK_MARKER', 'TEST_NAME_FORMAT', 'BENCHMARK_PATTERN')
+
+def _add_classifier_arguments(parser):
+    """Register the custom classifier options on a (sub)parser"""
+    parser.add_argument('--classifier', action='append', dest='custom_classifiers',
+                      help='Path to a Python file containing custom classifier implementation')
+    parser.add_argument('--classifier-dir', dest='classifier_dirs', action='append',
+                      help='Directory containing Python files with custom classifier implementations')
+
+def _add_parse_arguments(parser):
+    """Register the log parsing options on a (sub)parser"""
+    input_group = parser.add_argument_group('Input Options')
+    
+    log_source = input_group.add_mutually_exclusive_group(required=True)
+    log_source.add_argument('--log-dir', type=str,
+                      help='Directory containing log files')
+    log_source.add_argument('--log-file', type=str,
+                      help='Single log file to process')
+    
+    inject_source = input_group.add_mutually_exclusive_group(required=True)
+    inject_source.add_argument('--inject-dir', type=str,
+                      help='Directory containing injection JSON files')
+    inject_source.add_argument('--inject-file', type=str,
+                      help='Single injection JSON file to process')
+    
+    input_group.add_argument('--log-format', '-f', type=str, required=True,
+                      help='Path to log_format.py file containing custom patterns')
+    input_group.add_argument('--results-dir', type=str, default='results',
+                      help='Directory to save result JSON files (default: results)')
+    _add_classifier_arguments(input_group)
+
+def _add_db_arguments(parser):
+    """Register the database options on a (sub)parser"""
+    db_group = parser.add_argument_group('Database Options')
+    db_group.add_argument('--db', type=str, default='fault_analysis.db',
+                      help='Path to SQLite database (default: fault_analysis.db)')
+    db_group.add_argument('--create-db', action='store_true',
+                      help='Create a new database (will overwrite existing)')
+
+def _add_analysis_arguments(parser):
+    """Register the analysis and output options on a (sub)parser"""
+    analysis_group = parser.add_argument_group('Analysis Options')
+    selection = analysis_group.add_mutually_exclusive_group()
+    selection.add_argument('--benchmark', type=str,
+                      help='Specific benchmark to analyze')
+    selection.add_argument('--all-benchmarks', action='store_true',
+                      help='Analyze all benchmarks in the database')
+    analysis_group.add_argument('--status', type=str,
+                      help='Filter tests by status (e.g., trap, halt)')
+    
+    output_group = parser.add_argument_group('Output Options')
+    output_group.add_argument('--output-dir', type=str, default='plots',
+                      help='Directory to save output files (default: plots)')
+    output_group.add_argument('--combined', action='store_true',
+                      help='Create combined visualizations for all benchmarks')
+    output_group.add_argument('--skip-plots', action='store_true',
+                      help='Skip generating plots')
+    output_group.add_argument('--text-only', action='store_true',
+                      help='Only output text summaries (no graphical plots)')
+    output_group.add_argument('--force-plots', action='store_true',
+                      help='Regenerate plots even if their input data did not change')
+    output_group.add_argument('--dpi', type=int, default=150,
+                      help='Resolution of the generated plots (default: 150)')
+    output_group.add_argument('--plot-format', choices=['png', 'svg'], default='png',
+                      help='Image format of the trap cause and status charts (default: png)')
 
 def setup_argparse():
     """Setup command line argument parser"""
@@ -25,114 +87,95 @@ def setup_argparse():
         epilog="""
 Examples:
   # Monitor a file for changes
-  rapid.py --monitor --file output.log --alert-interval 30
+  rapid.py monitor --file output.log --alert-interval 30
 
   # Inject faults into a binary file
-  rapid.py --inject --binary-file program --num-flips 10 --output-dir inject/
+  rapid.py inject --binary-file program --num-flips 10 --output-dir inject/
   
   # Parse log files and create JSON results
-  rapid.py --parse-logs --log-dir logs/ --inject-dir inject/ --output-dir results/
+  rapid.py parse-logs --log-dir logs/ --inject-dir inject/ --log-format my_log_format.py --results-dir results/
   
   # Use custom classifiers
-  rapid.py --parse-logs --log-file log.txt --inject-file inject.json --classifier my_classifier.py
+  rapid.py parse-logs --log-file log.txt --inject-file inject.json --log-format my_log_format.py --classifier my_classifier.py
   
-  # List available classifiers (built-in and custom)
-  rapid.py --list-classifiers --classifier custom_classifier.py
+  # List available classifiers
+  rapid.py list-classifiers --classifier custom_classifier.py
   
   # Use multiple custom classifiers from a directory
-  rapid.py --parse-logs --log-dir logs/ --inject-dir inject/ --classifier-dir ./my_classifiers/
+  rapid.py parse-logs --log-dir logs/ --inject-dir inject/ --log-format my_log_format.py --classifier-dir ./my_classifiers/
   
   # Import results to database
-  rapid.py --import-results --results-dir results/ --db fault_analysis.db
+  rapid.py import-results --results-dir results/ --db fault_analysis.db
   
   # Analyze all benchmarks in database
-  rapid.py --analyze --db fault_analysis.db --all-benchmarks
+  rapid.py analyze --db fault_analysis.db --all-benchmarks
   
   # Full pipeline: parse logs, import to DB, and analyze
-  rapid.py --full-pipeline --log-dir logs/ --inject-dir inject/ --db fault_analysis.db --classifier-dir my_classifiers/
+  rapid.py full-pipeline --log-dir logs/ --inject-dir inject/ --log-format my_log_format.py --db fault_analysis.db --classifier-dir my_classifiers/
         """
     )
     
-    input_group = parser.add_argument_group('Input Options')
-    db_group = parser.add_argument_group('Database Options')
-    analysis_group = parser.add_argument_group('Analysis Options')
-    output_group = parser.add_argument_group('Output Options')
-    inject_group = parser.add_argument_group('Fault Injection Options')
-    monitor_group = parser.add_argument_group('File Monitoring Options')
-
-    # Pipeline options
-    parser.add_argument('--inject', action='store_true',
-                      help='Inject faults into binary file')
-    parser.add_argument('--parse-logs', action='store_true',
-                      help='Parse raw log files into structured JSON results')
-    parser.add_argument('--import-results', action='store_true',
-                      help='Import JSON results into the database')
-    parser.add_argument('--analyze', action='store_true',
-                      help='Analyze results from the database')
-    parser.add_argument('--full-pipeline', action='store_true',
-                      help='Run the complete pipeline: parse logs, import to DB, and analyze')
-    parser.add_argument('--monitor', action='store_true',
-                      help='Monitor a file for changes and alert when it becomes stuck')
-    parser.add_argument('-v', '--verbose', action='store_true',
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-v', '--verbose', action='store_true',
                       help='Enable verbose output')
     
-    # Fault injection options
-    inject_group.add_argument('--binary-file', type=str,
+    subparsers = parser.add_subparsers(dest='cmd', metavar='command', required=True)
+    
+    # Fault injection
+    inject_p = subparsers.add_parser('inject', parents=[common],
+                      help='Inject faults into binary file')
+    inject_group = inject_p.add_argument_group('Fault Injection Options')
+    inject_group.add_argument('--binary-file', type=str, required=True,
                       help='Binary file to inject faults into')
     inject_group.add_argument('--num-flips', type=int, default=10,
                       help='Number of bit flips to inject (default: 10)')
     inject_group.add_argument('--seed', type=int,
                       help='Random seed for reproducible fault injection')
+    inject_group.add_argument('--output-dir', type=str, default='inject',
+                      help='Directory to save the injected binaries (default: inject)')
     
-    # Input options
-    input_group.add_argument('--classifier', action='append', dest='custom_classifiers',
-                      help='Path to a Python file containing custom classifier implementation')
-    input_group.add_argument('--classifier-dir', dest='classifier_dirs', action='append',
-                      help='Directory containing Python files with custom classifier implementations')
-    input_group.add_argument('--list-classifiers', action='store_true',
-                      help='List all available classifiers')
-    input_group.add_argument('--log-dir', type=str,
-                      help='Directory containing log files')
-    input_group.add_argument('--log-file', type=str,
-                      help='Single log file to process')
-    input_group.add_argument('--inject-dir', type=str,
-                      help='Directory containing injection JSON files')
-    input_group.add_argument('--inject-file', type=str,
-                      help='Single injection JSON file to process')
-    input_group.add_argument('--results-dir', type=str, default='results',
+    # Log parsing
+    parse_p = subparsers.add_parser('parse-logs', parents=[common],
+                      help='Parse raw log files into structured JSON results')
+    _add_parse_arguments(parse_p)
+    
+    # Database import
+    import_p = subparsers.add_parser('import-results', aliases=['import'], parents=[common],
+                      help='Import JSON results into the database')
+    results_source = import_p.add_mutually_exclusive_group()
+    results_source.add_argument('--results-dir', type=str, default='results',
                       help='Directory containing result JSON files (default: results)')
-    input_group.add_argument('--results-file', type=str,
+    results_source.add_argument('--results-file', type=str,
                       help='Single result JSON file to process')
-    input_group.add_argument('--log-format', '-f', type=str,
-                      help='Path to log_format.py file containing custom patterns')
+    _add_db_arguments(import_p)
     
-    # Database options
-    db_group.add_argument('--db', type=str, default='fault_analysis.db',
+    # Analysis
+    analyze_p = subparsers.add_parser('analyze', parents=[common],
+                      help='Analyze results from the database')
+    analyze_p.add_argument('--db', type=str, default='fault_analysis.db',
                       help='Path to SQLite database (default: fault_analysis.db)')
-    db_group.add_argument('--create-db', action='store_true',
-                      help='Create a new database (will overwrite existing)')
-    db_group.add_argument('--list-benchmarks', action='store_true',
+    analyze_p.add_argument('--list-benchmarks', action='store_true',
                       help='List available benchmarks in the database')
+    _add_analysis_arguments(analyze_p)
     
-    # Analysis options
-    analysis_group.add_argument('--benchmark', type=str,
-                      help='Specific benchmark to analyze')
-    analysis_group.add_argument('--all-benchmarks', action='store_true',
-                      help='Analyze all benchmarks in the database')
-    analysis_group.add_argument('--status', type=str,
-                      help='Filter tests by status (e.g., trap, halt)')
+    # Full pipeline
+    pipeline_p = subparsers.add_parser('full-pipeline', parents=[common],
+                      help='Run the complete pipeline: parse logs, import to DB, and analyze')
+    _add_parse_arguments(pipeline_p)
+    _add_db_arguments(pipeline_p)
+    _add_analysis_arguments(pipeline_p)
+    pipeline_p.set_defaults(results_file=None, list_benchmarks=False)
     
-    # Output options
-    output_group.add_argument('--output-dir', type=str, default='plots',
-                      help='Directory to save output files (default: plots)')
-    output_group.add_argument('--combined', action='store_true',
-                      help='Create combined visualizations for all benchmarks')
-    output_group.add_argument('--skip-plots', action='store_true',
-                      help='Skip generating plots')
-    output_group.add_argument('--text-only', action='store_true',
-                      help='Only output text summaries (no graphical plots)')
+    # Classifier listing
+    list_p = subparsers.add_parser('list-classifiers', parents=[common],
+                      help='List all available classifiers')
+    _add_classifier_arguments(list_p)
     
-    monitor_group.add_argument('--file', type=str,
+    # File monitoring
+    monitor_p = subparsers.add_parser('monitor', parents=[common],
+                      help='Monitor a file for changes and alert when it becomes stuck')
+    monitor_group = monitor_p.add_argument_group('File Monitoring Options')
+    monitor_group.add_argument('--file', type=str, required=True,
                       help='File to monitor for changes')
     monitor_group.add_argument('--alert-interval', type=int, default=50,
                       help='Alert interval in seconds when file is stuck (default: 50)')
@@ -144,60 +187,25 @@ Examples:
 
 def find_matching_files(directory: str, pattern: str = None, extension: str = None) -> List[str]:
     """Find files matching pattern and/or extension in directory"""
-    if not os.path.isdir(directory):
+    files = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if extension and not entry.name.endswith(extension):
+                    continue
+                if pattern and pattern not in entry.name:
+                    continue
+                files.append(entry.path)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"Error: Directory not found: {directory}")
         return []
     
-    files = []
-    for filename in os.listdir(directory):
-        filepath = os.path.join(directory, filename)
-        if os.path.isfile(filepath):
-            if extension and not filename.endswith(extension):
-                continue
-            if pattern and pattern not in filename:
-                continue
-            files.append(filepath)
-    
     return files
 
 def parse_logs(args):
     """Parse benchmark output logs"""
-    if not args.log_file and not args.log_dir:
-        print("Error: Must specify either --log-file or --log-dir")
-        print("  Example: ./rapid.py --parse-logs --log-file tests.log --inject-file inject/matmul_bitflips.json --log-format my_log_format.py")
-        return False
-        
-    if not args.inject_file and not args.inject_dir:
-        print("Error: Must specify either --inject-file or --inject-dir")
-        print("  Example: ./rapid.py --parse-logs --log-file tests.log --inject-file inject/matmul_bitflips.json --log-format my_log_format.py")
-        return False
-        
-    if (args.log_file and not args.inject_file) or (args.inject_file and not args.log_file):
-        print("Error: Must specify either --log-file and --inject-file OR --log-dir and --inject-dir")
-        print("  Example: ./rapid.py --parse-logs --log-file tests.log --inject-file inject/matmul_bitflips.json --log-format my_log_format.py")
-        print("\nRequired parameters:")
-        print("  --log-format <file.py>     : Patterns for parsing the log file")
-        print("\nOptional classifier parameters:")
-        print("  --classifier <file.py>      : Use a custom classifier")
-        print("  --classifier-dir <dir>      : Use all classifiers in directory")
-        return False
-        
-    if (args.log_dir and not args.inject_dir) or (args.inject_dir and not args.log_dir):
-        print("Error: Must specify either --log-file and --inject-file OR --log-dir and --inject-dir")
-        print("  Example: ./rapid.py --parse-logs --log-dir logs/ --inject-dir inject/ --log-format my_log_format.py")
-        print("\nRequired parameters:")
-        print("  --log-format <file.py>     : Patterns for parsing the log file")
-        print("\nOptional classifier parameters:")
-        print("  --classifier <file.py>      : Use a custom classifier")
-        print("  --classifier-dir <dir>      : Use all classifiers in directory")
-        return False
-    
-    if not args.log_format:
-        print("Error: Must specify --log-format with log patterns")
-        print("\nUsage example:")
-        print("  ./rapid.py --parse-logs --log-file tests.log --inject-file inject.json --log-format my_log_format.py")
-        return False
-
     custom_patterns = {}
     if args.log_format:
         try:
@@ -208,14 +216,12 @@ def parse_logs(args):
                 spec.loader.exec_module(log_format)
                 
                 # Extract patterns from log_format.py
-                pattern_vars = ['TEST_NUMBER_PATTERN', 'TEST_BLOCK_MARKER', 
-                              'TEST_NAME_FORMAT', 'BENCHMARK_PATTERN']
+                module_vars = vars(log_format)
+                custom_patterns = {var.lower(): module_vars[var] for var in _PATTERN_VARS if var in module_vars}
                 
-                for var in pattern_vars:
-                    if hasattr(log_format, var):
-                        custom_patterns[var.lower()] = getattr(log_format, var)
-                        if args.verbose:
-                            print(f"Using custom {var}: {custom_patterns[var.lower()]}")
+                if args.verbose:
+                    for var, value in custom_patterns.items():
+                        print(f"Using custom {var.upper()}: {value}")
         except Exception as e:
             print(f"Error loading log format file: {e}")
 
@@ -235,8 +241,12 @@ def parse_logs(args):
     parsed_files = 0
     
     if args.log_file and args.inject_file:
-        if not os.path.exists(args.log_file) or not os.path.exists(args.inject_file):
-            print(f"Error: Log file or inject file not found")
+        # Open the inputs first: the parser picks a classifier from the inject file name alone
+        try:
+            open(args.log_file, 'rb').close()
+            open(args.inject_file, 'rb').close()
+        except FileNotFoundError as e:
+            print(f"Error: Log file or inject file not found: {e}")
             return False
         
         print(f"Processing log file: {args.log_file}")
@@ -251,11 +261,7 @@ def parse_logs(args):
             print(f"Error processing file: {e}")
             return False
     
-    elif args.log_dir and args.inject_dir:
-        if not os.path.isdir(args.log_dir) or not os.path.isdir(args.inject_dir):
-            print(f"Error: Log directory or inject directory not found")
-            return False
-        
+    else:
         log_files = find_matching_files(args.log_dir, extension='.txt')
         if not log_files:
             print(f"No log files found in {args.log_dir}")
@@ -267,20 +273,18 @@ def parse_logs(args):
             return False
         
         processed_pairs = []
+        inject_basenames = [(inject_file, os.path.basename(inject_file).split('.')[0])
+                            for inject_file in inject_files]
         
         for log_file in log_files:
-            log_basename = os.path.basename(log_file).split('.')[0]
+            log_parts = os.path.basename(log_file).split('.')[0].split('_')
             best_match = None
             best_score = 0
             
-            for inject_file in inject_files:
-                inject_basename = os.path.basename(inject_file).split('.')[0]
-                
-                # Simple matching heuristic: count common substrings
-                score = 0
-                for part in log_basename.split('_'):
-                    if part in inject_basename:
-                        score += len(part)
+            for inject_file, inject_basename in inject_basenames:
+                # Simple matching heuristic: total length of the log name parts
+                # that appear as substrings of the inject name
+                score = sum(map(len, filter(inject_basename.__contains__, log_parts)))
                 
                 if score > best_score:
                     best_score = score
@@ -302,19 +306,12 @@ def parse_logs(args):
             except Exception as e:
                 print(f"  Error processing files: {e}")
     
-    else:
-        print("Error: Must specify either --log-file and --inject-file OR --log-dir and --inject-dir")
-        print("  Example: ./RAPID.py --parse-logs --log-file tests.log --inject-file inject/matmul_bitflips.json")
-        return False
-    
     print(f"Parsing complete. Processed {parsed_files} files.")
     return parsed_files > 0
 
 def import_to_database(args):
     """Import results to database using ResultsDBConverter"""
-    if ResultsDBConverter is None:
-        print("Error: ResultsDBConverter module not found. Cannot import to database.")
-        return False
+    from .sql_converter import ResultsDBConverter
     
     converter = ResultsDBConverter(args.db)
 
@@ -325,31 +322,25 @@ def import_to_database(args):
     imported_files = 0
     
     if args.results_file:
-        if not os.path.exists(args.results_file):
-            print(f"Error: Results file not found: {args.results_file}")
-            return False
-        
         print(f"Importing file: {args.results_file}")
-        if converter.import_json_to_db(args.results_file):
-            imported_files += 1
+        try:
+            if converter.import_json_to_db(args.results_file):
+                imported_files += 1
+        except (FileNotFoundError, PermissionError) as e:
+            print(f"Error: Cannot read results file: {e}")
+            return False
     
     elif args.results_dir:
-        if not os.path.isdir(args.results_dir):
+        try:
+            import_stats = converter.import_directory(args.results_dir)
+        except (FileNotFoundError, NotADirectoryError):
             print(f"Error: Results directory not found: {args.results_dir}")
             return False
-        
-        result_files = find_matching_files(args.results_dir, extension='_results.json')
-        if not result_files:
-            print(f"No result files found in {args.results_dir}")
-            return False
-        
-        for result_file in result_files:
-            print(f"Importing file: {result_file}")
-            try:
-                if converter.import_json_to_db(result_file):
-                    imported_files += 1
-            except Exception as e:
-                print(f"  Error: {e}")
+        imported_files = converter.imported_files
+        if not import_stats and converter.skipped_files:
+            # Every results file found was already imported and is unchanged
+            print("Database is up to date.")
+            return True
     
     else:
         print("Error: Must specify either --results-file or --results-dir")
@@ -360,13 +351,7 @@ def import_to_database(args):
 
 def analyze_results(args):
     """Analyze results using ResultsAnalyzer and ResultsVisualizer"""
-    if ResultsAnalyzer is None:
-        print("Error: ResultsAnalyzer module not found. Cannot analyze results.")
-        return False
-    
-    if not os.path.exists(args.db):
-        print(f"Error: Database file not found: {args.db}")
-        return False
+    from .analyzer import ResultsAnalyzer
     
     os.makedirs(args.output_dir, exist_ok=True)
     temp_analyzer = ResultsAnalyzer(args.db)
@@ -374,8 +359,7 @@ def analyze_results(args):
     if args.list_benchmarks:
         benchmarks = temp_analyzer.get_available_benchmarks()
         print("\nAvailable benchmarks in database:")
-        for i, benchmark in enumerate(benchmarks, 1):
-            print(f"  {i}. {benchmark}")
+        sys.stdout.write(''.join(f"  {i}. {benchmark}\n" for i, benchmark in enumerate(benchmarks, 1)))
         return True
     
     benchmarks_to_analyze = []
@@ -388,29 +372,34 @@ def analyze_results(args):
         if not benchmarks:
             print("No benchmarks found in database!")
             return False
-            
-        print("\nAvailable benchmarks:")
-        for i, benchmark in enumerate(benchmarks, 1):
-            print(f"  {i}. {benchmark}")
         
-        try:
-            choice = input("\nEnter benchmark number to analyze (or empty for 'all'): ")
-            if not choice:
-                choice = 'all'
-            if choice.lower() == 'all':
-                benchmarks_to_analyze = benchmarks
-            else:
-                idx = int(choice) - 1
-                if 0 <= idx < len(benchmarks):
-                    benchmarks_to_analyze = [benchmarks[idx]]
+        # Nobody is there to answer the prompt: analyze everything
+        if args.cmd == 'full-pipeline' or not sys.stdin.isatty():
+            benchmarks_to_analyze = benchmarks
+        else:
+            print("\nAvailable benchmarks:")
+            sys.stdout.write(''.join(f"  {i}. {benchmark}\n" for i, benchmark in enumerate(benchmarks, 1)))
+            
+            try:
+                choice = input("\nEnter benchmark number to analyze (or empty for 'all'): ")
+                if not choice:
+                    choice = 'all'
+                if choice.lower() == 'all':
+                    benchmarks_to_analyze = benchmarks
                 else:
-                    print("Invalid selection!")
-                    return False
-        except (ValueError, IndexError):
-            print("Invalid selection!")
-            return False
+                    idx = int(choice) - 1
+                    if 0 <= idx < len(benchmarks):
+                        benchmarks_to_analyze = [benchmarks[idx]]
+                    else:
+                        print("Invalid selection!")
+                        return False
+            except (ValueError, IndexError):
+                print("Invalid selection!")
+                return False
         
+    # (analyzer, stats) per benchmark; the stats are computed once and shared by all reports
     all_analyzers = []
+    visualizer = None
     
     for benchmark in benchmarks_to_analyze:
         print(f"\n{'='*60}")
@@ -418,78 +407,68 @@ def analyze_results(args):
         print(f"{'='*60}")
         
         analyzer = ResultsAnalyzer(args.db, benchmark)
-        all_analyzers.append(analyzer)
+        stats = analyzer.compute_all_stats()
+        all_analyzers.append((analyzer, stats))
         
         if args.status:
             tests = analyzer.find_tests_with_status(args.status)
             print(f"\nTests with status '{args.status}':")
-            for test in tests:
-                print(f"  {test}")
+            sys.stdout.write(''.join(f"  {test}\n" for test in tests))
             print(f"Found {len(tests)} tests with '{args.status}' status")
         
-        analyzer.print_summary()
+        analyzer.print_summary(stats)
         
-        if not args.skip_plots and not args.text_only and ResultsVisualizer is not None:
+        if not args.skip_plots and not args.text_only:
+            from .visualizer import ResultsVisualizer
+            
             print("\nGenerating visualizations...")
-            visualizer = ResultsVisualizer(args.output_dir)
+            # One visualizer for all benchmarks so they share its figure
+            if visualizer is None:
+                visualizer = ResultsVisualizer(args.output_dir, force=args.force_plots, dpi=args.dpi)
             
-            bit_position_stats = analyzer.analyze_by_bit_position()
-            visualizer.plot_bit_position_impact(bit_position_stats, benchmark)
+            visualizer.plot_bit_position_impact(stats.bit_position_stats, benchmark)
             
-            counts = analyzer.get_status_hierarchy_counts()
-            coverage = analyzer.analyze_test_coverage()
-            total_tests = coverage["total_tests"]
-            visualizer.plot_status_hierarchy_bars(counts, total_tests, benchmark)
-    
-    if (args.combined and len(all_analyzers) > 1 and 
-        not args.skip_plots and not args.text_only and 
-        ResultsVisualizer is not None):
+            total_tests = stats.test_coverage["total_tests"]
+            visualizer.plot_status_hierarchy_bars(stats.hierarchy_counts, total_tests, benchmark,
+                                                  format=args.plot_format)
+    
+    if visualizer is not None:
+        visualizer.close()
+    
+    if args.combined and len(all_analyzers) > 1 and not args.skip_plots and not args.text_only:
         
         print("\nCreating combined visualizations for all benchmarks...")
         
         benchmark_data = {}
-        for analyzer in all_analyzers:
+        for analyzer, stats in all_analyzers:
             benchmark_name = analyzer.benchmark_name
             benchmark_data[benchmark_name] = {
                 'analyzer': analyzer,
-                'status_counts': analyzer.count_by_status(),
-                'bit_position_stats': analyzer.analyze_by_bit_position(),
-                'hierarchy_counts': analyzer.get_status_hierarchy_counts(),
-                'total_tests': analyzer.analyze_test_coverage()["total_tests"]
+                'status_counts': stats.status_counts,
+                'bit_position_stats': stats.bit_position_stats,
+                'hierarchy_counts': stats.hierarchy_counts,
+                'total_tests': stats.test_coverage["total_tests"]
             }
 
-        create_combined_visualizations(benchmark_data, args.output_dir)
+        create_combined_visualizations(benchmark_data, args.output_dir, args.dpi, args.plot_format)
     
     print("\nAnalysis complete!")
     return True
 
-def create_combined_visualizations(benchmark_data, output_dir):
+def create_combined_visualizations(benchmark_data, output_dir, dpi=150, plot_format='png'):
     """Create combined visualizations across multiple benchmarks"""
-    if ResultsVisualizer is None:
-        print("Warning: ResultsVisualizer module not found. Cannot create combined visualizations.")
-        return
+    from .visualizer import ResultsVisualizer
         
-    visualizer = ResultsVisualizer(output_dir)
+    visualizer = ResultsVisualizer(output_dir, dpi=dpi)
 
     if hasattr(visualizer, 'plot_trap_causes_comparison'):
         analyzers = {name: data['analyzer'] for name, data in benchmark_data.items()}
-        visualizer.plot_trap_causes_comparison(analyzers, top_n=5)
+        visualizer.plot_trap_causes_comparison(analyzers, top_n=5, format=plot_format)
+    visualizer.close()
 
 def inject_faults(args):
     """Inject faults into binary file using FaultInjecter"""
-    if FaultInjecter is None:
-        print("Error: FaultInjecter module not found. Cannot inject faults.")
-        return False
-    
-    if not args.binary_file:
-        print("Error: Must specify --binary-file for fault injection")
-        return False
-    
-    if not os.path.exists(args.binary_file):
-        print(f"Error: Binary file not found: {args.binary_file}")
-        return False
-    
-    output_dir = args.output_dir if args.output_dir else "inject"
+    from .injecter import FaultInjecter
     
     print(f"Injecting {args.num_flips} faults into {args.binary_file}")
     
@@ -499,21 +478,21 @@ def inject_faults(args):
         json_path = injecter.inject_and_save(
             args.binary_file, 
             args.num_flips,
-            output_dir,
+            args.output_dir,
             args.seed
         )
         print(f"Fault injection complete. Information saved to {json_path}")
         return True
+    except FileNotFoundError:
+        print(f"Error: Binary file not found: {args.binary_file}")
+        return False
     except Exception as e:
         print(f"Error during fault injection: {e}")
         return False
 
 def monitor_file(args):
     """Monitor a file for changes and alert when it becomes stuck"""
-    
-    if not args.file:
-        print("Error: Must specify --file to monitor")
-        return False
+    from .utils.candaguardia import CanDaGuardia
     
     try:
         monitor = CanDaGuardia(args.sound_file)
@@ -527,107 +506,87 @@ def monitor_file(args):
         return False
 
 
-def main():
-    parser = setup_argparse()
-    args = parser.parse_args()
-    
-    if args.inject:
-        if FaultInjecter is None:
-            print("Error: FaultInjecter module required for fault injection")
-            return 1
-    
-    if args.parse_logs or args.full_pipeline or args.list_classifiers:
-        if ResultsParser is None:
-            print("Error: ResultsParser module required for log parsing")
-            return 1
+def list_classifiers(args):
+    """List the available classifiers"""
+    print("\nLoading classifiers...")
+    try:
+        classifiers = ResultsParser.get_all_classifiers(
+            args.custom_classifiers, 
+            args.classifier_dirs
+        )
+        print("\nAvailable classifiers:")
+        print("-" * 20)
         
-        if args.list_classifiers:
-            print("\nLoading classifiers...")
-            try:
-                classifiers = ResultsParser.get_all_classifiers(
-                    args.custom_classifiers, 
-                    args.classifier_dirs
-                )
-                print("\nAvailable classifiers:")
-                print("-" * 20)
-                
-                # Group classifiers as built-in or custom
-                built_in = []
-                custom = []
-                
-                for name, classifier in classifiers.items():
-                    if classifier.__class__.__module__.startswith('classifiers.benchmark_classifiers'):
-                        built_in.append(name)
-                    else:
-                        custom.append(name)
-                
-                if built_in:
-                    print("Built-in classifiers:")
-                    for name in sorted(built_in):
-                        print(f"  - {name}")
-                
-                if custom:
-                    print("\nCustom classifiers:")
-                    for name in sorted(custom):
-                        print(f"  - {name}")
-                
-                if not classifiers:
-                    print("  No classifiers found")
-                    
-            except Exception as e:
-                print(f"Error loading classifiers: {e}")
-            return 0
-    
-    if args.import_results or args.full_pipeline:
-        if ResultsDBConverter is None:
-            print("Error: ResultsDBConverter module required for database import")
-            return 1
-    
-    if args.analyze or args.full_pipeline:
-        if ResultsAnalyzer is None:
-            print("Error: ResultsAnalyzer module required for analysis")
-            return 1
-    
-    print("\n" + "=" * 75)
-    print("RAPID: Reliability Analysis and Precision Injection Diagnostic")
-    print("=" * 75 + "\n")
+        # Group classifiers as built-in or custom
+        built_in = []
+        custom = []
+        
+        for name, classifier in classifiers.items():
+            if classifier.__class__.__module__.startswith('classifiers.benchmark_classifiers'):
+                built_in.append(name)
+            else:
+                custom.append(name)
+        
+        if built_in:
+            print("Built-in classifiers:")
+            built_in_text = ''.join(f"  - {name}\n" for name in sorted(built_in))
+            sys.stdout.write(built_in_text)
+        
+        if custom:
+            print("\nCustom classifiers:")
+            custom_text = ''.join(f"  - {name}\n" for name in sorted(custom))
+            sys.stdout.write(custom_text)
+        
+        if not classifiers:
+            print("  No classifiers found")
+            
+    except Exception as e:
+        print(f"Error loading classifiers: {e}")
+    return True
+
+def full_pipeline(args):
+    """Run the complete pipeline: parse logs, import to DB, and analyze"""
+    print("Running full pipeline: parse logs, import to DB, and analyze")
     
-    if args.monitor:
-        return 0 if monitor_file(args) else 1
+    if not parse_logs(args):
+        print("Error in log parsing step. Pipeline aborted.")
+        return False
+        
+    if not import_to_database(args):
+        print("Error in database import step. Pipeline aborted.")
+        return False
+        
+    if not analyze_results(args):
+        print("Error in analysis step.")
+        return False
     
-    if args.inject:
-        if not inject_faults(args):
-            return 1
+    return True
+
+COMMANDS = {
+    'inject': inject_faults,
+    'parse-logs': parse_logs,
+    'import-results': import_to_database,
+    'import': import_to_database,
+    'analyze': analyze_results,
+    'full-pipeline': full_pipeline,
+    'list-classifiers': list_classifiers,
+    'monitor': monitor_file,
+}
+
+def main():
+    parser = setup_argparse()
+    args = parser.parse_args()
     
-    if args.full_pipeline:
-        print("Running full pipeline: parse logs, import to DB, and analyze")
-        
-        if not parse_logs(args):
-            print("Error in log parsing step. Pipeline aborted.")
-            return 1
-            
-        if not import_to_database(args):
-            print("Error in database import step. Pipeline aborted.")
-            return 1
-            
-        if not analyze_results(args):
-            print("Error in analysis step.")
-            return 1
+    # --log-file/--inject-file and --log-dir/--inject-dir only make sense in pairs
+    if args.cmd in ('parse-logs', 'full-pipeline') and bool(args.log_file) != bool(args.inject_file):
+        parser.error("must specify either --log-file and --inject-file OR --log-dir and --inject-dir")
     
-    else:
-        if args.parse_logs:
-            if not parse_logs(args):
-                return 1
-                
-        if args.import_results:
-            if not import_to_database(args):
-                return 1
-                
-        if args.analyze or args.list_benchmarks:
-            if not analyze_results(args):
-                return 1
+    if args.cmd != 'list-classifiers':
+        print("\n" + "=" * 75)
+        print("RAPID: Reliability Analysis and Precision Injection Diagnostic")
+        print("=" * 75 + "\n")
     
-    return 0
+    return 0 if COMMANDS[args.cmd](args) else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -1,13 +1,117 @@
 import os
-import json
+import re
 import sqlite3
+import fnmatch
 import argparse
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Dict, Any, Iterator, List
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Results files at least this large are streamed with ijson (when installed)
+# instead of being decoded into memory in one go
+STREAM_THRESHOLD = 256 * 1024 * 1024
+
+# Number of tests whose rows are buffered before being written with executemany
+INSERT_BATCH_SIZE = 10000
+
+_JSON_ERRORS = (_json.JSONDecodeError,) if ijson is None else (_json.JSONDecodeError, ijson.JSONError)
+
+# Errors that abort the import of a single results file
+_IMPORT_ERRORS = (*_JSON_ERRORS, FileNotFoundError, sqlite3.IntegrityError)
+
+# Re-importing a results file first removes the tests it added before; status and events follow by cascade
+DELETE_SOURCE_FILE_SQL = "DELETE FROM tests WHERE source_file = ?"
+# Tests imported before their results file was recorded are replaced by test_id instead
+DELETE_LEGACY_TEST_SQL = "DELETE FROM tests WHERE source_file IS NULL AND test_id = ?"
+INSERT_TEST_SQL = "INSERT INTO tests VALUES (?, ?, ?, ?, ?, ?, ?)"
+INSERT_STATUS_SQL = "INSERT INTO status VALUES (?, ?, ?)"
+INSERT_EVENT_SQL = "INSERT INTO events VALUES (?, ?, ?, ?, ?)"
+DELETE_PART_SOURCE_FILES_SQL = "DELETE FROM tests WHERE source_file IN (SELECT DISTINCT source_file FROM part.tests)"
+DELETE_PART_LEGACY_TESTS_SQL = "DELETE FROM tests WHERE source_file IS NULL AND test_id IN (SELECT test_id FROM part.tests)"
+# An import record only counts while the tests of that file are still in the database
+SELECT_IMPORT_SQL = ("SELECT mtime, size FROM imports WHERE path = ? "
+                     "AND EXISTS (SELECT 1 FROM tests WHERE source_file = imports.path)")
+RECORD_IMPORT_SQL = "INSERT OR REPLACE INTO imports VALUES (?, ?, ?)"
+
+# Tables copied when merging the per-worker databases of a parallel import
+TABLES = ('tests', 'status', 'events')
+
+# Views exposing the events table with the layout of the former per-event tables
+EVENT_VIEWS = {
+    'traps': 'trap',
+    'halts': 'halt',
+    'hw_resets': 'hw_reset',
+    'comm_failure': 'comm_failure',
+    'exec_failure': 'exec_failure',
+}
+
+def _register_value(value):
+    """Convert a trap register value (int or numeric string such as '0x8000') to an integer"""
+    if isinstance(value, str):
+        try:
+            value = int(value, 0)
+        except ValueError:
+            return value
+    # SQLite integers are signed 64-bit; keep the two's complement bit pattern
+    if isinstance(value, int) and value >= 1 << 63:
+        value -= 1 << 64
+    return value
+
+def _iter_files(directory: str, pattern: str, recursive: bool = False) -> Iterator[str]:
+    """Lazily yield the files in a directory whose name matches a shell pattern
+    
+    Unreadable subdirectories are skipped; an unreadable directory itself raises OSError.
+    """
+    match = re.compile(fnmatch.translate(pattern)).match
+    stack = [directory]
+    while stack:
+        path = stack.pop()
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            if path == directory:
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.is_file() and match(entry.name):
+                    yield entry.path
+
+def _remove_database_files(db_path: str) -> None:
+    """Remove a database file together with its WAL side files"""
+    for suffix in ('', '-wal', '-shm'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+def _import_part(results_file: str, part_path: str) -> int:
+    """Import a results file into a private database (runs in a worker process)"""
+    _remove_database_files(part_path)
+    converter = ResultsDBConverter(part_path)
+    try:
+        return converter.import_json_to_db(results_file)
+    finally:
+        converter.close()
 
 class ResultsDBConverter:
     def __init__(self, db_path: str):
         """Initialize converter with a database path"""
         self.db_path = db_path
+        # Number of files the last import_directory() call imported and skipped as unchanged
+        self.imported_files = 0
+        self.skipped_files = 0
         self.conn = self._setup_database()
 
     def create_database(self):
@@ -19,14 +123,23 @@ class ResultsDBConverter:
         """Delete the database file"""
         self.conn.close()
         if os.path.exists(self.db_path):
-            os.remove(self.db_path)
+            # Leftover WAL files must not be applied to a new database with the same name
+            _remove_database_files(self.db_path)
             print(f"Deleted database: {self.db_path}")
         else:
             print(f"Database not found: {self.db_path}")
         
     def _setup_database(self) -> sqlite3.Connection:
         """Create the database schema if it doesn't exist"""
-        conn = sqlite3.connect(self.db_path)
+        # Transactions are managed explicitly with BEGIN/COMMIT
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        conn.executescript("""
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -65536;
+            PRAGMA mmap_size = 268435456;
+        """)
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -36,9 +149,13 @@ class ResultsDBConverter:
             bit_position INTEGER,
             args TEXT,
             output TEXT,
-            needs_manual_check BOOLEAN
+            needs_manual_check BOOLEAN,
+            source_file TEXT
         )
         ''')
+        self._add_source_file_column(cursor)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tests_benchmark ON tests(benchmark, needs_manual_check)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tests_source_file ON tests(source_file)")
 
         # =========== Status =============
         
@@ -48,161 +165,339 @@ class ResultsDBConverter:
             class TEXT,
             SDC BOOLEAN,
             PRIMARY KEY (test_id),
-            FOREIGN KEY (test_id) REFERENCES tests(test_id)
+            FOREIGN KEY (test_id) REFERENCES tests(test_id) ON DELETE CASCADE
         )
         ''')
         
         # ============ Events =============
 
         cursor.execute('''
-        CREATE TABLE IF NOT EXISTS traps (
-            test_id TEXT PRIMARY KEY,
-            scause TEXT,
-            sepc TEXT,
-            stval TEXT,
-            FOREIGN KEY (test_id) REFERENCES tests(test_id)
-        )
-        ''')
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS halts (
-            test_id TEXT PRIMARY KEY,
-            halt BOOLEAN,
-            FOREIGN KEY (test_id) REFERENCES tests(test_id)
-        )
-        ''')
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS hw_resets (
-            test_id TEXT PRIMARY KEY,
-            hw_reset BOOLEAN,
-            FOREIGN KEY (test_id) REFERENCES tests(test_id)
-        )
-        ''')
-
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS comm_failure (
-            test_id TEXT PRIMARY KEY,
-            comm_failure BOOLEAN,
-            FOREIGN KEY (test_id) REFERENCES tests(test_id)
+        CREATE TABLE IF NOT EXISTS events (
+            test_id TEXT,
+            type TEXT,
+            scause INTEGER,
+            sepc INTEGER,
+            stval INTEGER,
+            PRIMARY KEY (test_id, type),
+            FOREIGN KEY (test_id) REFERENCES tests(test_id) ON DELETE CASCADE
         )
         ''')
-
+        
+        self._migrate_event_tables(cursor)
+        cursor.execute("UPDATE OR REPLACE events SET type = 'hw_reset' WHERE type = 'hw-reset'")
+        self._add_delete_cascade(cursor)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_type ON events(type)")
+        for view, event_type in EVENT_VIEWS.items():
+            columns = "scause, sepc, stval" if event_type == 'trap' else f"1 AS {event_type}"
+            cursor.execute(f"CREATE VIEW IF NOT EXISTS {view} AS "
+                           f"SELECT test_id, {columns} FROM events WHERE type = '{event_type}'")
+        
+        # =========== Imported files =============
+        
         cursor.execute('''
-        CREATE TABLE IF NOT EXISTS exec_failure (
-            test_id TEXT PRIMARY KEY,
-            exec_failure BOOLEAN,
-            FOREIGN KEY (test_id) REFERENCES tests(test_id)
+        CREATE TABLE IF NOT EXISTS imports (
+            path TEXT PRIMARY KEY,
+            mtime REAL,
+            size INTEGER
         )
         ''')
         
         conn.commit()
+        conn.execute("PRAGMA foreign_keys = ON")
+        cursor.execute("SELECT EXISTS (SELECT 1 FROM tests WHERE source_file IS NULL)")
+        self._legacy_tests = bool(cursor.fetchone()[0])
         return conn
 
+    @staticmethod
+    def _add_source_file_column(cursor: sqlite3.Cursor) -> None:
+        """Add the results file column to a tests table created without it"""
+        cursor.execute("PRAGMA table_info(tests)")
+        if 'source_file' not in (column[1] for column in cursor.fetchall()):
+            cursor.execute("ALTER TABLE tests ADD COLUMN source_file TEXT")
+
+    @staticmethod
+    def _migrate_event_tables(cursor: sqlite3.Cursor) -> None:
+        """Move the rows of the former per-event tables into the events table"""
+        for view, event_type in EVENT_VIEWS.items():
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (view,))
+            if cursor.fetchone() is None:
+                continue
+            if event_type == 'trap':
+                # The former traps table stored the registers as TEXT
+                rows = cursor.execute("SELECT test_id, scause, sepc, stval FROM traps").fetchall()
+                cursor.executemany("INSERT OR REPLACE INTO events VALUES (?, 'trap', ?, ?, ?)",
+                                   [(test_id, *map(_register_value, registers)) for test_id, *registers in rows])
+            else:
+                cursor.execute(f"INSERT OR REPLACE INTO events SELECT test_id, '{event_type}', NULL, NULL, NULL FROM {view}")
+            cursor.execute(f"DROP TABLE {view}")
+    
+    @staticmethod
+    def _add_delete_cascade(cursor: sqlite3.Cursor) -> None:
+        """Rebuild child tables created before their foreign keys cascaded deletes"""
+        for table in ('status', 'events'):
+            cursor.execute(f"PRAGMA foreign_key_list({table})")
+            if all(fk[6] == 'CASCADE' for fk in cursor.fetchall()):
+                continue
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,))
+            create_sql = cursor.fetchone()[0].replace("REFERENCES tests(test_id)",
+                                                      "REFERENCES tests(test_id) ON DELETE CASCADE")
+            # Keep the views on events pointing at the table name during the rename
+            cursor.execute("PRAGMA legacy_alter_table = ON")
+            cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_old")
+            cursor.execute("PRAGMA legacy_alter_table = OFF")
+            cursor.execute(create_sql)
+            cursor.execute(f"INSERT INTO {table} SELECT * FROM {table}_old")
+            cursor.execute(f"DROP TABLE {table}_old")
+    
     def _get_benchmark_name(self, results_file: str) -> str:
         """Extract benchmark name from filename"""
         basename = os.path.basename(results_file)
         name = basename.split('_')[0]
         return name
     
+    def _iter_test_results(self, f):
+        """Yield (test_id, test_data) pairs from an open unbuffered results file"""
+        size = os.fstat(f.fileno()).st_size
+        if ijson is not None and size >= STREAM_THRESHOLD:
+            return ijson.kvitems(f, '', use_float=True)
+        
+        # Read straight into one preallocated buffer; it is dropped as soon as it is parsed
+        buf = bytearray(size)
+        with memoryview(buf) as view:
+            pos = 0
+            while pos < size:
+                n = f.readinto(view[pos:])
+                if not n:
+                    break
+                pos += n
+        del buf[pos:]
+        return _json.loads(buf).items()
+    
+    @staticmethod
+    def _flush_batches(cursor: sqlite3.Cursor, batches) -> None:
+        """Insert and clear the buffered rows of each (sql, rows) batch"""
+        for sql, rows in batches:
+            if rows:
+                cursor.executemany(sql, rows)
+                rows.clear()
+    
     def import_json_to_db(self, results_file: str) -> int:
         """Import a JSON results file into the database"""
         try:
-            with open(results_file, 'r') as f:
-                data = json.load(f)
+            self.conn.execute("BEGIN TRANSACTION")
+            imported_count = self._import_json_no_commit(results_file)
+            self.conn.commit()
+            return imported_count
             
+        except _IMPORT_ERRORS as e:
+            print(f"Error loading results file: {e}")
+            return 0
+        finally:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+    
+    def _import_json_no_commit(self, results_file: str) -> int:
+        """Insert a JSON results file inside the current transaction, raising on errors"""
+        with open(results_file, 'rb', buffering=0) as f:
             benchmark = self._get_benchmark_name(results_file)
+            source_file = os.path.abspath(results_file)
             
             cursor = self.conn.cursor()
             imported_count = 0
             
-            self.conn.execute("BEGIN TRANSACTION")
+            legacy_rows = []
+            tests_rows = []
+            status_rows = []
+            events_rows = []
+            batches = [
+                (DELETE_LEGACY_TEST_SQL, legacy_rows),
+                (INSERT_TEST_SQL, tests_rows),
+                (INSERT_STATUS_SQL, status_rows),
+                (INSERT_EVENT_SQL, events_rows),
+            ]
+            
+            cursor.execute(DELETE_SOURCE_FILE_SQL, (source_file,))
             
-            for test_id, test_data in data.items():
+            # Bound once per file, like the benchmark name every test row shares
+            append_legacy = legacy_rows.append if self._legacy_tests else None
+            append_test = tests_rows.append
+            append_status = status_rows.append
+            extend_events = events_rows.extend
+            
+            for test_id, test_data in self._iter_test_results(f):
                 bit_position = test_data.get('bit_position', None)
                 output = test_data.get('output', None)
-                needs_manual_check = 1 if test_data.get('needs_manual_check', False) else 0
+                needs_manual_check = bool(test_data.get('needs_manual_check'))
                 args = test_data.get('args', None)
 
-                cursor.execute(
-                    "INSERT OR REPLACE INTO tests VALUES (?, ?, ?, ?, ?, ?)",
-                    (test_id, benchmark, bit_position, args, output, needs_manual_check)
-                )
-                
+                if append_legacy:
+                    append_legacy((test_id,))
+                append_test((test_id, benchmark, bit_position, args, output, needs_manual_check, source_file))
+            
                 status = test_data.get('status', {})
-                cursor.execute(
-                    "INSERT OR REPLACE INTO status VALUES (?, ?, ?)",
-                    (test_id, status.get('class'), status.get('SDC'))
-                )
-                
-                events = test_data.get('status').get('events', [])
-                for event in events:
-                    if event['type'] == 'trap':
-                        scause_val = str(event.get('scause')) if event.get('scause') is not None else None
-                        sepc_val = str(event.get('sepc')) if event.get('sepc') is not None else None
-                        stval_val = str(event.get('stval')) if event.get('stval') is not None else None
-                        
-                        cursor.execute(
-                            "INSERT OR REPLACE INTO traps VALUES (?, ?, ?, ?)",
-                            (test_id, scause_val, sepc_val, stval_val)
-                        )
-                    elif event['type'] == 'halt':
-                        cursor.execute(
-                            "INSERT OR REPLACE INTO halts VALUES (?, ?)",
-                            (test_id, 1)
-                        )
-                    elif event['type'] == 'hw_reset':
-                        cursor.execute(
-                            "INSERT OR REPLACE INTO hw_resets VALUES (?, ?)",
-                            (test_id, 1)
-                        )
-                    elif event['type'] == 'comm_failure':
-                        cursor.execute(
-                            "INSERT OR REPLACE INTO comm_failure VALUES (?, ?)",
-                            (test_id, 1)
-                        )
-                    elif event['type'] == 'exec_failure':
-                        cursor.execute(
-                            "INSERT OR REPLACE INTO exec_failure VALUES (?, ?)",
-                            (test_id, 1)
-                        )
+                sdc = status.get('SDC')
+                append_status((test_id, status.get('class'), None if sdc is None else int(sdc)))
+            
+                # Only the last event of each type is kept for a test
+                test_events = {}
+                for event in status.get('events', ()):
+                    # The parser writes 'hw-reset'; event types are stored with underscores
+                    event_type = event['type'].replace('-', '_')
+                    if event_type == 'trap':
+                        test_events[event_type] = (test_id, event_type, _register_value(event.get('scause')),
+                                                   _register_value(event.get('sepc')),
+                                                   _register_value(event.get('stval')))
+                    else:
+                        test_events[event_type] = (test_id, event_type, None, None, None)
+                extend_events(test_events.values())
 
                 imported_count += 1
-                
-            self.conn.commit()
-            print(f"Successfully imported {imported_count} test results for benchmark {benchmark}")
-            return imported_count
+                if imported_count % INSERT_BATCH_SIZE == 0:
+                    self._flush_batches(cursor, batches)
             
-        except (json.JSONDecodeError, FileNotFoundError) as e:
-            print(f"Error loading results file: {e}")
-            return 0
+            self._flush_batches(cursor, batches)
+            
+        print(f"Successfully imported {imported_count} test results for benchmark {benchmark}")
+        return imported_count
+
+    def _is_imported(self, results_file: str, st: os.stat_result) -> bool:
+        """Check whether a results file was already imported, is unchanged since and still has its tests"""
+        row = self.conn.execute(SELECT_IMPORT_SQL, (os.path.abspath(results_file),)).fetchone()
+        return row == (st.st_mtime, st.st_size)
+    
+    def _record_import(self, results_file: str, st: os.stat_result) -> None:
+        """Remember the modification time and size of an imported results file"""
+        self.conn.execute(RECORD_IMPORT_SQL, (os.path.abspath(results_file), st.st_mtime, st.st_size))
+    
+    def _merge_part(self, part_path: str) -> None:
+        """Copy the content of a per-worker database into this database"""
+        self.conn.execute("ATTACH DATABASE ? AS part", (part_path,))
+        try:
+            self.conn.execute("BEGIN TRANSACTION")
+            self.conn.execute(DELETE_PART_SOURCE_FILES_SQL)
+            if self._legacy_tests:
+                self.conn.execute(DELETE_PART_LEGACY_TESTS_SQL)
+            for table in TABLES:
+                self.conn.execute(f"INSERT INTO {table} SELECT * FROM part.{table}")
+            self.conn.commit()
+        finally:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+            self.conn.execute("DETACH DATABASE part")
     
-    def import_directory(self, directory: str, pattern: str = '*_results.json', recursive: bool = False) -> Dict[str, int]:
-        """Import all matching JSON files from a directory"""
-        import glob
+    def import_directory(self, directory: str, pattern: str = '*_results.json', recursive: bool = False,
+                         max_workers: int = None) -> Dict[str, int]:
+        """Import all matching JSON files from a directory
         
-        if recursive:
-            pattern = os.path.join(directory, '**', pattern)
-            json_files = glob.glob(pattern, recursive=True)
-        else:
-            pattern = os.path.join(directory, pattern)
-            json_files = glob.glob(pattern)
+        Files whose modification time and size match a previous import are skipped;
+        their number is left in self.skipped_files, that of the imported files in self.imported_files. With more than one worker, files are imported in parallel processes, each
+        into its own temporary database, which are then merged into this one. A missing directory
+        raises FileNotFoundError (NotADirectoryError for a file).
+        """
+        found = skipped = 0
         
-        if not json_files:
-            print(f"No matching JSON files found in {directory}")
-            return {}
+        def pending_files():
+            nonlocal found, skipped
+            for json_file in _iter_files(directory, pattern, recursive):
+                found += 1
+                st = os.stat(json_file)
+                if self._is_imported(json_file, st):
+                    skipped += 1
+                    continue
+                yield json_file, st
+        
+        # Peek at the first files: a pool is only worth starting for more than one
+        files = pending_files()
+        head = list(islice(files, 2))
+        files = chain(head, files)
         
-        print(f"Found {len(json_files)} JSON files to import")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
         
         import_stats = {}
-        for json_file in json_files:
-            print(f"Importing {json_file}...")
-            benchmark = self._get_benchmark_name(json_file)
-            count = self.import_json_to_db(json_file)
-            import_stats[benchmark] = count
+        if len(head) < 2 or max_workers <= 1 or self.db_path == ':memory:':
+            imported = self._import_files_sequential(files, import_stats)
+        else:
+            imported = self._import_files_parallel(files, import_stats, max_workers)
+        
+        if not found:
+            print(f"No matching JSON files found in {directory}")
+        elif skipped:
+            print(f"Skipped {skipped} unchanged files already in the database")
         
+        self.imported_files = imported
+        self.skipped_files = skipped
         return import_stats
     
+    def _import_files_sequential(self, files, import_stats: Dict[str, int]) -> int:
+        """Import (path, stat) pairs in a single transaction and return the number of imported files"""
+        # A savepoint per file keeps a broken file from discarding the others
+        imported = 0
+        try:
+            self.conn.execute("BEGIN TRANSACTION")
+            for json_file, st in files:
+                print(f"Importing {json_file}...")
+                benchmark = self._get_benchmark_name(json_file)
+                self.conn.execute("SAVEPOINT import_file")
+                try:
+                    count = self._import_json_no_commit(json_file)
+                except _IMPORT_ERRORS as e:
+                    self.conn.execute("ROLLBACK TO import_file")
+                    print(f"Error loading results file: {e}")
+                    count = 0
+                except Exception as e:
+                    # Same as a failing worker in the parallel import: skip the file, keep the rest
+                    self.conn.execute("ROLLBACK TO import_file")
+                    print(f"Error importing {json_file}: {e}")
+                    count = 0
+                if count:
+                    self._record_import(json_file, st)
+                    imported += 1
+                self.conn.execute("RELEASE import_file")
+                import_stats[benchmark] = count
+            self.conn.commit()
+        finally:
+            if self.conn.in_transaction:
+                self.conn.rollback()
+        return imported
+    
+    def _import_files_parallel(self, files, import_stats: Dict[str, int], max_workers: int) -> int:
+        """Import (path, stat) pairs in worker processes, merge their databases and return the number of imported files"""
+        imported = 0
+        submitted = []
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # Files are handed to the workers while the directory is still being walked
+                for i, (json_file, st) in enumerate(files):
+                    print(f"Importing {json_file}...")
+                    part_path = f"{self.db_path}.part{i}"
+                    future = executor.submit(_import_part, json_file, part_path)
+                    submitted.append((json_file, st, part_path, future))
+                
+                # Merge in submission order so that later files win, as in a sequential import
+                for json_file, st, part_path, future in submitted:
+                    benchmark = self._get_benchmark_name(json_file)
+                    try:
+                        count = future.result()
+                    except Exception as e:
+                        print(f"Error importing {json_file}: {e}")
+                        count = 0
+                    if count:
+                        try:
+                            self._merge_part(part_path)
+                        except sqlite3.IntegrityError as e:
+                            # e.g. a test_id already stored under another benchmark
+                            print(f"Error loading results file: {e}")
+                            count = 0
+                    if count:
+                        self._record_import(json_file, st)
+                        imported += 1
+                    import_stats[benchmark] = count
+        finally:
+            for _, _, part_path, _ in submitted:
+                _remove_database_files(part_path)
+        return imported
+    
     def get_benchmarks(self) -> List[str]:
         """Get list of all benchmarks in the database"""
         cursor = self.conn.cursor()
@@ -4,6 +4,16 @@ import subprocess
 from time import sleep
 from typing import Optional
 
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+try:
+    import simpleaudio
+except ImportError:
+    simpleaudio = None
+
 class CanDaGuardia:
     """
     A utility for monitoring file changes and alerting when a file becomes stuck.
@@ -20,6 +30,15 @@ class CanDaGuardia:
             Path to the sound file to play when an alert is triggered
         """
         self.sound_file = sound_file if os.path.exists(sound_file) else None
+        self._player = None
+        
+        # Decode WAV files once so that alerts do not spawn a player process
+        self._wave = None
+        if self.sound_file and simpleaudio is not None:
+            try:
+                self._wave = simpleaudio.WaveObject.from_wave_file(self.sound_file)
+            except Exception:
+                self._wave = None
     
     def monitor(self, file_path: str, alert_interval: int = 50, verbose: bool = False) -> None:
         """
@@ -41,42 +60,68 @@ class CanDaGuardia:
         print("Press Ctrl+C to stop monitoring.")
         
         with open(file_path, 'rb') as f:
-            start_time = time.time()
-            cur_time = start_time
+            inotify = None
+            if INotify is not None:
+                # Sleep in the kernel until the file is written, for at most alert_interval.
+                # Events only wake the loop up; the size check below decides what changed
+                inotify = INotify()
+                inotify.add_watch(file_path, flags.MODIFY)
+                wait_for_change = lambda: inotify.read(timeout=int(alert_interval * 1000))
+            else:
+                wait_for_change = lambda: sleep(1)
+            
+            fd = f.fileno()
+            old_size = os.fstat(fd).st_size
+            last_change = time.time()
             stuck = False
             last_alert_time = 0
-            f.seek(0, 2)  # Go to end of file
-            old_data = f.read()
             
             try:
                 while True:
-                    data = f.read()
+                    wait_for_change()
                     cur_time = time.time()
                     
-                    if data == old_data and data:  # Only consider stuck if there's data
-                        if not stuck and verbose:
-                            print(f"No changes detected since {time.strftime('%H:%M:%S', time.localtime(cur_time))}")
-                        stuck = True
-                    elif data:  # Only update if there's actual data
+                    # Only the bytes appended since the last check are read
+                    size = os.fstat(fd).st_size
+                    truncated = size < old_size
+                    if truncated:
+                        old_size = 0
+                    chunk = os.pread(fd, size - old_size, old_size) if size > old_size else b''
+                    old_size += len(chunk)
+                    
+                    if chunk or truncated:
                         if verbose:
                             print(f"File updated at {time.strftime('%H:%M:%S', time.localtime(cur_time))}")
+                            if chunk:
+                                print(chunk.decode(errors='replace'), end='' if chunk.endswith(b'\n') else '\n')
                         stuck = False
-                        old_data = data
+                        last_change = cur_time
+                    else:
+                        if not stuck and verbose:
+                            print(f"No changes detected since {time.strftime('%H:%M:%S', time.localtime(last_change))}")
+                        stuck = True
                     
-                    if stuck and (cur_time - last_alert_time > alert_interval):
-                        print(f"⚠️ ALERT: File appears to be stuck! Last change was {int(cur_time - (cur_time - last_alert_time))} seconds ago")
+                    if (stuck and cur_time - last_change >= alert_interval
+                            and cur_time - last_alert_time >= alert_interval):
+                        print(f"⚠️ ALERT: File appears to be stuck! Last change was {int(cur_time - last_change)} seconds ago")
                         self._play_alert()
                         last_alert_time = cur_time
-                    
-                    sleep(1)
             except KeyboardInterrupt:
                 print("\nMonitoring stopped.")
+            finally:
+                if inotify is not None:
+                    inotify.close()
     
     def _play_alert(self) -> None:
         """Play alert sound if sound file is available"""
-        if self.sound_file:
+        if self._wave is not None:
+            self._wave.play()
+        elif self.sound_file:
+            # poll() reaps the previous player; skip the alert while it is still playing
+            if self._player is not None and self._player.poll() is None:
+                return
             try:
-                subprocess.Popen(
+                self._player = subprocess.Popen(
                     ["paplay", self.sound_file], 
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL
@@ -1,12 +1,94 @@
 import os
-import matplotlib.pyplot as plt
+import json
+import hashlib
 import numpy as np
-from matplotlib.ticker import FuncFormatter
-from matplotlib.patches import Patch
 import math
+import types
+from functools import cache, cached_property
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Status types with at least this many bit positions are chunked by the numba kernel if available
+JIT_THRESHOLD = 1_000_000
+
+_TRAP_COLOR = '#9b59b6'     # Purple
+_OTHERS_COLOR = '#95a5a6'   # Gray
+
+# pyplot scans the font cache when imported, so it is only loaded once a plot is drawn
+_plt = None
+
+def _get_plt():
+    """Import matplotlib.pyplot with the Agg backend on first use"""
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use("Agg")  # Plots are only written to files; skip GUI backend setup
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
+@cache
+def _get_styles():
+    """Build the matplotlib objects shared by all charts once"""
+    plt = _get_plt()
+    from matplotlib.font_manager import FontProperties
+    from matplotlib.ticker import FuncFormatter
+    return types.SimpleNamespace(
+        # Fonts of the bar value labels, resolved once instead of per label
+        bar_label_font=FontProperties(size=9),
+        small_bar_label_font=FontProperties(size=8),
+        bold_bar_label_font=FontProperties(weight='bold'),
+        tab10=tuple(plt.cm.tab10(i) for i in range(10)),
+        # Formats x-axis ticks in thousands (k); stateless, so one instance serves every chart
+        k_tick_formatter=FuncFormatter(lambda x, pos: f"{int(x/1000)}k"),
+    )
+
+if njit is not None:
+    @njit(cache=True)
+    def _chunk_hist(keys, values, min_pos, chunk_size, num_chunks):
+        """Sum values into num_chunks bins of chunk_size positions starting at min_pos in one pass"""
+        out = np.zeros(num_chunks)
+        for i in range(keys.shape[0]):
+            idx = (keys[i] - min_pos) // chunk_size
+            if 0 <= idx < num_chunks:
+                out[idx] += values[i]
+        return out
+else:
+    _chunk_hist = None
+
+def _render_single_trap_chart(benchmark, trap_data, output_file, dpi, format):
+    """Draw the top trap causes chart of one benchmark (runs in a worker process)"""
+    plt = _get_plt()
+    causes, counts, total = trap_data
+    percentages = counts * (100.0 / total)
+    
+    fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
+    bar_colors = [_TRAP_COLOR if cause != "Others" else _OTHERS_COLOR for cause in causes]
+    bars = ax.bar(range(len(causes)), percentages, color=bar_colors, alpha=0.8)
+    ax.bar_label(bars, labels=[f'{c} ({p:.1f}%)' for c, p in zip(counts, percentages)],
+                 padding=3, fontproperties=_get_styles().bar_label_font)
+    
+    ax.set_title(f'Top Trap Causes for {benchmark}', fontsize=16)
+    ax.set_ylabel('Percentage of Traps (%)', fontsize=14)
+    ax.set_xlabel('Trap Cause', fontsize=14)
+    ax.set_xticks(range(len(causes)), causes, rotation=45, ha='right')
+    ax.grid(axis='y', linestyle='--', alpha=0.5)
+    ax.text(0.02, 0.95, f'Total Traps: {total}', 
+            transform=ax.transAxes, fontsize=12,
+            bbox=dict(boxstyle='round,pad=0.5', fc='white', alpha=0.8))
+    
+    fig.savefig(output_file, format=format, dpi=dpi)
+    plt.close(fig)
+    return output_file
 
 class ResultsVisualizer:
-    STATUS_COLORS = {
+    # Read-only so the shared class-level palettes cannot be changed by accident
+    STATUS_COLORS = types.MappingProxyType({
         'passed': '#2ecc71',     # Green
         'failed': '#e74c3c',     # Red
         'halt': '#f39c12',    # Orange
@@ -17,37 +99,147 @@ class ResultsVisualizer:
         'comm_failure': '#34495e',  # Navy
         'missing': '#95a5a6',    # Gray
         'unknown': '#7f8c8d'     # Dark Gray
-    }
+    })
     
-    SUBCAT_COLORS = {
+    SUBCAT_COLORS = types.MappingProxyType({
         "clean": "#a9dfbf",       # Light green
         "trap": "#9b59b6",   # Purple
-        "trap": "#9b59b6",   # Purple
         "SDC": "#e67e22", # Orange
         "halt": "#f39c12",     # Yellow-orange
         "comm_failure": "#34495e",   # Navy
         "other": "#95a5a6",       # Gray
         "all": "#85c1e9"          # Light blue
-    }
+    })
+    
+    # Bar colors of the passed/failed/outlier totals
+    _MAIN_STATUS_COLORS = (STATUS_COLORS["passed"], STATUS_COLORS["failed"], STATUS_COLORS["outlier"])
     
-    LINE_STYLES = {
+    # Hatches of the bars within a benchmark group, doubled for a denser pattern
+    HATCH_DOUBLED = tuple(h * 2 for h in ('', '/', '\\', 'x', '-', '+', 'o', 'O', '.', 'x'))
+    
+    LINE_STYLES = types.MappingProxyType({
         'passed': '-',
         'failed': '--',
         'trap': '-.',
         'halt': ':'
-    }
-    
-    @staticmethod
-    def _format_k_ticks(x, pos):
-        """Format x-axis ticks in thousands (k)"""
-        return f"{int(x/1000)}k"
+    })
     
-    def __init__(self, output_dir="plots"):
-        """Initialize visualizer with output directory"""
+    def __init__(self, output_dir="plots", force=False, dpi=150):
+        """Initialize visualizer with output directory
+        
+        Parameters:
+        -----------
+        output_dir : str, optional
+            Directory to save the plots
+        force : bool, optional
+            Regenerate plots even if their inputs did not change since the last run
+        dpi : int, optional
+            Resolution of the saved images (default: 150)
+        """
         self.output_dir = output_dir
+        self.force = force
+        self.dpi = dpi
+        self._fig = None
+        self._ax = None
+        self._status_legend_saved = False
         os.makedirs(output_dir, exist_ok=True)
+    
+    def _get_scratch_axes(self, figsize):
+        """Return the cleared axes of the figure shared by all charts of this visualizer"""
+        if self._fig is None:
+            self._fig = _get_plt().figure(figsize=figsize, layout='constrained')
+            self._ax = self._fig.add_subplot(111)
+        else:
+            self._fig.set_size_inches(*figsize)
+            self._ax.clear()
+        return self._ax
+    
+    def close(self):
+        """Release the shared figure"""
+        if self._fig is not None:
+            _get_plt().close(self._fig)
+            self._fig = None
+            self._ax = None
+    
+    @staticmethod
+    def _inputs_hash(*inputs):
+        """Hash the data a plot is drawn from"""
+        data = json.dumps(inputs, sort_keys=True, default=str)
+        return hashlib.sha1(data.encode()).hexdigest()
+    
+    def _is_up_to_date(self, output_file, key):
+        """Check whether output_file was already rendered from inputs with the given hash"""
+        if self.force:
+            return False
+        try:
+            with open(output_file + '.hash') as f:
+                return f.read() == key and os.path.exists(output_file)
+        except FileNotFoundError:
+            return False
+    
+    @staticmethod
+    def _save_hash(output_file, key):
+        """Record the inputs hash next to a rendered plot"""
+        with open(output_file + '.hash', 'w') as f:
+            f.write(key)
+
+    @cached_property
+    def _status_legend_handles(self):
+        """Legend entries of the status hierarchy chart, built once per visualizer"""
+        from matplotlib.patches import Patch
+        return [
+            Patch(facecolor=self.STATUS_COLORS["passed"], alpha=0.7, label="Passed (Total)"),
+            Patch(facecolor=self.SUBCAT_COLORS["clean"], label="Passed - Clean"),
+            Patch(facecolor=self.SUBCAT_COLORS["trap"], label="Passed - With Trap"),
+            Patch(facecolor=self.SUBCAT_COLORS["SDC"], label="Passed - SDC"),
+        
+            Patch(facecolor='none', label=''),  # Empty spacer
+        
+            Patch(facecolor=self.STATUS_COLORS["failed"], alpha=0.7, label="Failed (Total)"),
+            Patch(facecolor=self.SUBCAT_COLORS["clean"], label="Failed - Clean"),
+            Patch(facecolor=self.SUBCAT_COLORS["trap"], label="Failed - With Trap"),
+            Patch(facecolor=self.SUBCAT_COLORS["halt"], label="Failed - Halt"),
+            Patch(facecolor=self.SUBCAT_COLORS["comm_failure"], label="Failed - Communication Failure"),
+            Patch(facecolor=self.SUBCAT_COLORS["other"], label="Failed - Multiple Issues"),
+        
+            Patch(facecolor='none', label=''),  # Empty spacer
+        
+            Patch(facecolor=self.STATUS_COLORS["outlier"], alpha=0.7, label="Outlier (Total)"),
+            Patch(facecolor=self.SUBCAT_COLORS["trap"], label="Outlier - With Trap"),
+            Patch(facecolor=self.SUBCAT_COLORS["halt"], label="Outlier - Halt"),
+            Patch(facecolor=self.SUBCAT_COLORS["comm_failure"], label="Outlier - Communication Failure")
+        ]
+    
+    def save_status_legend(self, output_dir=None, format="png"):
+        """Save the legend shared by all status hierarchy charts as its own image
+        
+        Parameters:
+        -----------
+        output_dir : str, optional
+            Directory to save the legend (defaults to self.output_dir if None)
+        format : str, optional
+            Image format of the legend, "png" or "svg" (default: "png")
+        """
+        if output_dir is None:
+            output_dir = self.output_dir
+        self._status_legend_saved = True
+        
+        output_file = os.path.join(output_dir, f"status_legend.{format}")
+        key = self._inputs_hash([handle.get_label() for handle in self._status_legend_handles],
+                                self.STATUS_COLORS, self.SUBCAT_COLORS, self.dpi)
+        if self._is_up_to_date(output_file, key):
+            return
+        
+        plt = _get_plt()
+        fig = plt.figure(figsize=(4, 5))
+        fig.legend(handles=self._status_legend_handles, loc='center', fontsize=10, ncol=1)
+        # The legend has no axes to lay out, so the image is cropped to it instead
+        fig.savefig(output_file, format=format, dpi=self.dpi, bbox_inches='tight')
+        plt.close(fig)
+        self._save_hash(output_file, key)
+        print(f"Status legend saved to {output_file}")
 
-    def plot_trap_causes_comparison(self, benchmark_analyzers, output_dir=None, top_n=5):
+    def plot_trap_causes_comparison(self, benchmark_analyzers, output_dir=None, top_n=5, format="png"):
         """Create a grouped bar chart comparing top trap causes across multiple benchmarks
         
         Parameters:
@@ -58,72 +250,55 @@ class ResultsVisualizer:
             Directory to save the plot (defaults to self.output_dir if None)
         top_n : int, optional
             Number of top trap causes to display for each benchmark (default: 5)
+        format : str, optional
+            Image format of the charts, "png" or "svg" (default: "png"). These charts
+            only hold a handful of bars and labels, so SVG skips rasterization and
+            stays sharp at any zoom while usually being smaller than the PNG
         """
         if output_dir is None:
             output_dir = self.output_dir
         
-        # Get trap causes for all benchmarks
+        # Get trap causes for all benchmarks, sorted once as (causes, counts, total)
+        # with the remaining causes folded into a trailing "Others" entry
         benchmark_trap_data = {}
         
         for name, analyzer in benchmark_analyzers.items():
             trap_causes = analyzer.count_by_trap_cause()
             if trap_causes:
                 sorted_causes = sorted(trap_causes.items(), key=lambda x: x[1], reverse=True)
-                top_causes = dict(sorted_causes[:4])
+                causes = [cause for cause, _ in sorted_causes[:4]]
+                counts = [count for _, count in sorted_causes[:4]]
                 
-                if len(sorted_causes) > 4:
-                    other_count = sum(count for _, count in sorted_causes[4:])
-                    if other_count > 0:
-                        top_causes["Others"] = other_count
+                other_count = sum(count for _, count in sorted_causes[4:])
+                if other_count > 0:
+                    causes.append("Others")
+                    counts.append(other_count)
                 
-                benchmark_trap_data[name] = top_causes
+                counts = np.array(counts)
+                benchmark_trap_data[name] = (causes, counts, int(counts.sum()))
         
         if not benchmark_trap_data:
             print("No trap data available for any benchmark")
             return
         
-        hatch_patterns = ['', '/', '\\', 'x', '-', '+', 'o', 'O', '.', 'x']
+        # The per-benchmark charts are independent, so they are rendered in parallel
+        benchmarks = list(benchmark_trap_data)
+        output_files = [os.path.join(output_dir, f"{benchmark}_trap_causes.{format}")
+                        for benchmark in benchmarks]
+        render_args = (benchmarks, benchmark_trap_data.values(), output_files,
+                       repeat(self.dpi), repeat(format))
+        max_workers = min(len(benchmarks), os.cpu_count() or 1)
+        if max_workers > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                rendered = list(executor.map(_render_single_trap_chart, *render_args))
+        else:
+            rendered = list(map(_render_single_trap_chart, *render_args))
         
-        for benchmark, trap_causes in benchmark_trap_data.items():
-            if not trap_causes:
-                continue
-                
-            causes_sorted = sorted(trap_causes.items(), key=lambda x: x[1], reverse=True)
-            if "Others" in trap_causes:
-                causes_sorted = [item for item in causes_sorted if item[0] != "Others"]
-                causes_sorted.append(("Others", trap_causes["Others"]))
-            
-            causes = [cause for cause, _ in causes_sorted]
-            counts = [count for _, count in causes_sorted]
-            total = sum(counts)
-            percentages = [(count / total) * 100 for count in counts]
-            
-            plt.figure(figsize=(12, 7))
-            bar_colors = ['#9b59b6' if cause != "Others" else '#95a5a6' for cause in causes]
-            bars = plt.bar(range(len(causes)), percentages, color=bar_colors, alpha=0.8)
-            for i, (bar, count) in enumerate(zip(bars, counts)):
-                height = bar.get_height()
-                plt.text(bar.get_x() + bar.get_width()/2., height + 1,
-                        f'{count} ({percentages[i]:.1f}%)',
-                        ha='center', va='bottom', fontsize=9)
-            
-            plt.title(f'Top Trap Causes for {benchmark}', fontsize=16)
-            plt.ylabel('Percentage of Traps (%)', fontsize=14)
-            plt.xlabel('Trap Cause', fontsize=14)
-            plt.xticks(range(len(causes)), causes, rotation=45, ha='right')
-            plt.grid(axis='y', linestyle='--', alpha=0.5)
-            plt.text(0.02, 0.95, f'Total Traps: {total}', 
-                    transform=plt.gca().transAxes, fontsize=12,
-                    bbox=dict(boxstyle='round,pad=0.5', fc='white', alpha=0.8))
-            plt.tight_layout()
-            
-            output_file = os.path.join(output_dir, f"{benchmark}_trap_causes.png")
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        for benchmark, output_file in zip(benchmarks, rendered):
             print(f"Trap causes chart for {benchmark} saved to {output_file}")
-            plt.close()
         
         if len(benchmark_trap_data) > 1:
-            plt.figure(figsize=(14, 8))
+            ax = self._get_scratch_axes((14, 8))
             
             num_benchmarks = len(benchmark_trap_data)
             columns_per_benchmark = 5
@@ -135,72 +310,72 @@ class ResultsVisualizer:
             all_labels = []
             current_x = 0
             
-            benchmark_colors = [plt.cm.tab10(i % 10) for i in range(num_benchmarks)]
+            # Bars, labels and separators of all benchmarks are collected and drawn in one go
+            bar_positions = []
+            bar_heights = []
+            bar_colors = []
+            bar_hatch_indices = []
+            separators = []
+            mid_xs = []
+            totals = []
             
-            for i, (benchmark, trap_causes) in enumerate(benchmark_trap_data.items()):
-                sorted_causes = sorted(trap_causes.items(), key=lambda x: x[1], reverse=True)
-                if "Others" in trap_causes:
-                    sorted_causes = [item for item in sorted_causes if item[0] != "Others"]
-                    sorted_causes.append(("Others", trap_causes["Others"]))
-                
-                causes = [cause for cause, _ in sorted_causes]
-                counts = [count for _, count in sorted_causes]
-                
-                while len(causes) < 5:
-                    causes.append("")
-                    counts.append(0)
-                    
-                total = sum([c for c in counts if c > 0])
-                percentages = [(count / total) * 100 if total > 0 and count > 0 else 0 for count in counts]
-                positions = [current_x + j * bar_width * 1.2 for j in range(len(causes))]
-                
-                for pos, label in zip(positions, causes):
-                    all_positions.append(pos)
-                    all_labels.append(label)
+            tab10 = _get_styles().tab10
+            benchmark_colors = [tab10[i % 10] for i in range(num_benchmarks)]
+            
+            for i, (benchmark, (causes, counts, total)) in enumerate(benchmark_trap_data.items()):
+                padding = 5 - len(causes)
+                causes = causes + [""] * padding
+                percentages = np.pad(counts * (100.0 / total), (0, padding))
+                positions = current_x + np.arange(len(causes)) * bar_width * 1.2
                 
-                benchmark_color = benchmark_colors[i]
-                for j, (position, percentage, cause) in enumerate(zip(positions, percentages, causes)):
-                    if percentage > 0:
-                        bar = plt.bar(position, percentage, width=bar_width, 
-                                  color=benchmark_color, 
-                                  alpha=0.7,
-                                  edgecolor='black',
-                                  linewidth=1)
-                        
-                        if j < len(hatch_patterns):
-                            bar[0].set_hatch(hatch_patterns[j] * 2)
+                all_positions.extend(positions)
+                all_labels.extend(causes)
                 
-                for j, (position, percentage, count) in enumerate(zip(positions, percentages, counts)):
-                    if count > 0:
-                        plt.text(position, percentage + 1,
-                                f'{percentage:.1f}%',
-                                ha='center', va='bottom', fontsize=8,
-                                color='black')
+                # Only causes with traps get a bar; the padding slots stay empty
+                mask = percentages > 0
+                hatch_indices = np.flatnonzero(mask)
+                bar_positions.append(positions[mask])
+                bar_heights.append(percentages[mask])
+                bar_colors.extend([benchmark_colors[i]] * len(hatch_indices))
+                bar_hatch_indices.extend(hatch_indices.tolist())
                 
+                mid_xs.append((positions[0] + positions[-1]) / 2)
+                totals.append(total)
                 if i < num_benchmarks - 1:
-                    plt.axvline(x=positions[-1] + bar_width * 1.5, 
-                              color='black', linestyle='-', alpha=0.3)
+                    separators.append(positions[-1] + bar_width * 1.5)
                 
                 current_x = positions[-1] + bar_width * 3
             
-            plt.xticks(all_positions, all_labels, rotation=45, ha='right', fontsize=9, color='black')
+            bar_positions = np.concatenate(bar_positions)
+            bar_heights = np.concatenate(bar_heights)
+            bars = ax.bar(bar_positions, bar_heights, width=bar_width,
+                          color=bar_colors,
+                          alpha=0.7,
+                          edgecolor='black',
+                          linewidth=1)
+            for bar, hatch_index in zip(bars, bar_hatch_indices):
+                bar.set_hatch(self.HATCH_DOUBLED[hatch_index])
             
-            current_x = 0
-            for i, benchmark in enumerate(benchmark_trap_data.keys()):
-                positions = [current_x + j * bar_width * 1.2 for j in range(5)]
-                mid_x = (positions[0] + positions[-1]) / 2
-                plt.text(mid_x, -8, benchmark, ha='center', va='top', fontsize=11,
+            ax.bar_label(bars, labels=[f'{p:.1f}%' for p in bar_heights],
+                         padding=3, fontproperties=_get_styles().small_bar_label_font, color='black')
+            
+            if separators:
+                ax.vlines(separators, 0, 1, transform=ax.get_xaxis_transform(),
+                          colors='black', linestyles='-', alpha=0.3)
+            
+            ax.set_xticks(all_positions, all_labels, rotation=45, ha='right', fontsize=9, color='black')
+            
+            for mid_x, benchmark in zip(mid_xs, benchmark_trap_data):
+                ax.text(mid_x, -8, benchmark, ha='center', va='top', fontsize=11,
                        fontweight='bold', color='black')
-                current_x = positions[-1] + bar_width * 3
             
-            plt.ylabel('Percentage of Traps (%)', fontsize=14, color='black')
-            plt.title('Top Trap Causes by Benchmark', fontsize=16, color='black')
-            plt.grid(axis='y', linestyle='--', alpha=0.7)
+            ax.set_ylabel('Percentage of Traps (%)', fontsize=14, color='black')
+            ax.set_title('Top Trap Causes by Benchmark', fontsize=16, color='black')
+            ax.grid(axis='y', linestyle='--', alpha=0.7)
 
             y_offset = 0.05
-            for i, (benchmark, causes) in enumerate(benchmark_trap_data.items()):
-                total = sum(causes.values())
-                plt.annotate(f'{benchmark}: {total} traps', 
+            for i, (benchmark, total) in enumerate(zip(benchmark_trap_data, totals)):
+                ax.annotate(f'{benchmark}: {total} traps', 
                             xy=(0.02, 0.95 - i*y_offset), 
                             xycoords='axes fraction',
                             fontsize=10,
@@ -208,12 +383,9 @@ class ResultsVisualizer:
                             bbox=dict(boxstyle='round,pad=0.3', fc='white', alpha=0.8, 
                                      ec='black'))
             
-            plt.tight_layout()
-            
-            output_file = os.path.join(output_dir, f"trap_causes_comparison.png")
-            plt.savefig(output_file, dpi=300, bbox_inches='tight')
+            output_file = os.path.join(output_dir, f"trap_causes_comparison.{format}")
+            self._fig.savefig(output_file, format=format, dpi=self.dpi)
             print(f"Combined trap causes comparison chart saved to {output_file}")
-            plt.close()
 
     def plot_bit_position_impact(self, bit_position_stats, benchmark_name, num_chunks=30):
         """Create a line chart showing the impact of bit position on test outcomes
@@ -225,84 +397,139 @@ class ResultsVisualizer:
         benchmark_name : str
             Name of the benchmark for plot title
         num_chunks : int, default=30
-            Number of chunks to divide the bit positions into
+            Number of chunks to divide the bit positions into, capped at the
+            horizontal pixel count of the figure
         """
         if not any(bit_position_stats.values()):
             print("No bit position data available for plotting")
             return
         
-        plt.figure(figsize=(14, 8))
+        output_file = os.path.join(self.output_dir, f"{benchmark_name}_bit_position_impact.png")
+        key = self._inputs_hash(bit_position_stats, benchmark_name, num_chunks, self.dpi)
+        if self._is_up_to_date(output_file, key):
+            print(f"Bit position impact chart {output_file} is up to date")
+            return
+        
+        fig_width, fig_height = 14, 8
+        
+        # No point in more chunks than there are pixels to draw them on
+        num_chunks = min(num_chunks, int(fig_width * self.dpi))
                 
-        max_bit_pos = 0
-        min_bit_pos = float('inf')
-        for positions in bit_position_stats.values():
-            if positions:
-                max_bit_pos = max(max_bit_pos, max(positions.keys() or [0]))
-                min_bit_pos = min(min_bit_pos, min(positions.keys() or [float('inf')]))
+        keys = {}
+        values = {}
+        for status_type, positions in bit_position_stats.items():
+            keys[status_type] = np.fromiter(positions.keys(), dtype=np.int64, count=len(positions))
+            values[status_type] = np.fromiter(positions.values(), dtype=np.float64, count=len(positions))
         
-        if min_bit_pos == float('inf'):
-            min_bit_pos = 0
+        all_keys = np.concatenate(list(keys.values()))
+        max_bit_pos = max(0, int(all_keys.max()))
+        min_bit_pos = int(all_keys.min())
         
         bit_range = max_bit_pos - min_bit_pos + 1
         chunk_size = max(1, bit_range // num_chunks)
         num_chunks = math.ceil(bit_range / chunk_size)
         
-        chunk_data = {status_type: [0] * num_chunks for status_type in bit_position_stats.keys()}
+        # Histogram every status type in C rather than one bit position at a time
+        chunk_data = {}
+        for status_type in bit_position_stats:
+            if _chunk_hist is not None and len(keys[status_type]) >= JIT_THRESHOLD:
+                chunk_data[status_type] = _chunk_hist(keys[status_type], values[status_type],
+                                                      min_bit_pos, chunk_size, num_chunks)
+                continue
+            idx = (keys[status_type] - min_bit_pos) // chunk_size
+            mask = (idx >= 0) & (idx < num_chunks)
+            chunk_data[status_type] = np.bincount(idx[mask], weights=values[status_type][mask],
+                                                  minlength=num_chunks)
         
-        for status_type, positions in bit_position_stats.items():
-            for bit_pos, count in positions.items():
-                chunk_idx = (bit_pos - min_bit_pos) // chunk_size
-                if 0 <= chunk_idx < num_chunks:
-                    chunk_data[status_type][chunk_idx] += count
-        
-        x_points = [min_bit_pos + (i * chunk_size) + chunk_size/2 for i in range(num_chunks)]
-        
-        for status_type, counts in chunk_data.items():
-            if sum(counts) > 0:
-                plt.plot(
-                    x_points, 
-                    counts, 
-                    label=status_type.capitalize(),
-                    linestyle=self.LINE_STYLES.get(status_type, '-'),
-                    color=self.STATUS_COLORS.get(status_type, 'black'),
-                    linewidth=2, 
-                    marker='o',
-                    markersize=4
-                )
-        
-        plt.xlabel('Bit Position', fontsize=14)
-        plt.ylabel('Count', fontsize=14)
-        plt.title(f'Impact of Bit Position on Test Outcomes for {benchmark_name}', fontsize=16)
-        plt.gca().xaxis.set_major_formatter(FuncFormatter(self._format_k_ticks))
-        plt.grid(True, linestyle='--', alpha=0.7)
-        plt.legend(loc='upper right', fontsize=12)
-        plt.text(0.02, 0.98, f"Chunk size: {chunk_size} bits", 
-                transform=plt.gca().transAxes, fontsize=10, 
+        if not any(counts.any() for counts in chunk_data.values()):
+            print("No bit position data available for plotting")
+            return
+        
+        ax = self._get_scratch_axes((fig_width, fig_height))
+        x_points = np.arange(num_chunks, dtype=np.float64) * chunk_size + (min_bit_pos + chunk_size * 0.5)
+        
+        # Drop the markers on dense lines and never draw more than ~100 of them
+        marker = 'o' if num_chunks <= 200 else None
+        markevery = max(1, num_chunks // 100)
+        
+        from matplotlib.collections import LineCollection
+        from matplotlib.lines import Line2D
+        
+        # All status lines go into one LineCollection and all markers into one scatter
+        drawn = [(status_type, counts) for status_type, counts in chunk_data.items() if counts.any()]
+        colors = [self.STATUS_COLORS.get(status_type, 'black') for status_type, _ in drawn]
+        linestyles = [self.LINE_STYLES.get(status_type, '-') for status_type, _ in drawn]
+        
+        ax.add_collection(LineCollection([np.column_stack((x_points, counts)) for _, counts in drawn],
+                                         colors=colors, linestyles=linestyles, linewidths=2))
+        if marker is not None:
+            marker_x = x_points[::markevery]
+            ax.scatter(np.tile(marker_x, len(drawn)),
+                       np.concatenate([counts[::markevery] for _, counts in drawn]),
+                       s=16, c=np.repeat(colors, len(marker_x)), marker=marker, zorder=3)
+        ax.autoscale_view()
+        
+        legend_handles = [Line2D([], [], color=color, linestyle=linestyle, linewidth=2,
+                                 marker=marker, markersize=4, label=status_type.capitalize())
+                          for (status_type, _), color, linestyle in zip(drawn, colors, linestyles)]
+        
+        ax.set_xlabel('Bit Position', fontsize=14)
+        ax.set_ylabel('Count', fontsize=14)
+        ax.set_title(f'Impact of Bit Position on Test Outcomes for {benchmark_name}', fontsize=16)
+        ax.xaxis.set_major_formatter(_get_styles().k_tick_formatter)
+        ax.grid(True, linestyle='--', alpha=0.7)
+        ax.legend(handles=legend_handles, loc='upper right', fontsize=12)
+        ax.text(0.02, 0.98, f"Chunk size: {chunk_size} bits", 
+                transform=ax.transAxes, fontsize=10, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
         
-        output_file = os.path.join(self.output_dir, f"{benchmark_name}_bit_position_impact.png")
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
+        self._fig.savefig(output_file, dpi=self.dpi)
+        self._save_hash(output_file, key)
         print(f"Bit position impact chart saved to {output_file}")
-        plt.close()
     
-    def plot_status_hierarchy_bars(self, counts, total_tests, benchmark_name):
-        """Create a bar chart showing hierarchical status categories and their combinations"""
+    def plot_status_hierarchy_bars(self, counts, total_tests, benchmark_name, format="png"):
+        """Create a bar chart showing hierarchical status categories and their combinations
+        
+        Parameters:
+        -----------
+        counts : dict
+            Test counts per main status category and subcategory
+        total_tests : int
+            Total number of tests of the benchmark
+        benchmark_name : str
+            Name of the benchmark
+        format : str, optional
+            Image format of the chart, "png" or "svg" (default: "png"). The chart has
+            few primitives, so SVG is cheap to write and scales without blurring
+        """
         if total_tests == 0:
             print("No test data available for plotting")
             return
         
-        fig, ax = plt.subplots(figsize=(14, 8))
+        # The legend is the same for every benchmark, so it is written once to its own image
+        if not self._status_legend_saved:
+            self.save_status_legend(format=format)
         
-        main_bar_width = 0.5
-        sub_bar_width = main_bar_width / 5
-        index = np.arange(3)
+        output_file = os.path.join(self.output_dir, f"{benchmark_name}_status_bars.{format}")
+        key = self._inputs_hash(counts, total_tests, benchmark_name, self.dpi)
+        if self._is_up_to_date(output_file, key):
+            print(f"Status hierarchy bar chart {output_file} is up to date")
+            return
         
         main_categories = ["passed", "failed", "outlier"]
         main_totals = [counts[cat]["total"] for cat in main_categories]
-        main_colors = [self.STATUS_COLORS.get(cat, '#888888') for cat in main_categories]
+        if not any(main_totals):
+            print("No test data available for plotting")
+            return
+        
+        ax = self._get_scratch_axes((14, 8))
+        
+        main_bar_width = 0.5
+        sub_bar_width = main_bar_width / 5
+        index = np.arange(3)
         
         main_bars = ax.bar(index, main_totals, main_bar_width, 
-                        color=main_colors, label="Total", alpha=0.8)
+                        color=self._MAIN_STATUS_COLORS, label="Total", alpha=0.8)
         
         subcategories = {
             "passed": ["clean", "trap", "SDC"],
@@ -310,60 +537,36 @@ class ResultsVisualizer:
             "outlier": ["trap", "halt", "comm_failure"]
         }
         
+        sub_positions = []
+        sub_counts = []
+        sub_colors = []
         for i, main_cat in enumerate(main_categories):
-            subcats = subcategories[main_cat]
-            for j, subcat in enumerate(subcats):
-                pos = index[i] - main_bar_width/2 + (j+0.5)*sub_bar_width
-                count = counts[main_cat][subcat]
-                if count > 0:
-                    ax.bar(pos, count, sub_bar_width, 
-                        color=self.SUBCAT_COLORS.get(subcat, '#888888'),
-                        label=f"{main_cat}:{subcat}" if i == 0 else "_nolegend_")
-        
-        for bar in main_bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width() / 2, height + 5,
-                    f"{int(height)}", ha='center', va='bottom', fontweight='bold')
+            for j, subcat in enumerate(subcategories[main_cat]):
+                sub_positions.append(index[i] - main_bar_width/2 + (j+0.5)*sub_bar_width)
+                sub_counts.append(counts[main_cat][subcat])
+                sub_colors.append(self.SUBCAT_COLORS[subcat])
+        
+        # Empty subcategories get no bar; the legend is built from fixed handles
+        sub_counts = np.asarray(sub_counts)
+        mask = sub_counts > 0
+        ax.bar(np.asarray(sub_positions)[mask], sub_counts[mask], sub_bar_width,
+               color=[color for color, shown in zip(sub_colors, mask) if shown])
+        
+        ax.bar_label(main_bars, labels=[str(int(total)) for total in main_totals],
+                     padding=3, fontproperties=_get_styles().bold_bar_label_font)
         
         y_max = max(main_totals) * 1.15
         ax.set_ylim(0, y_max)
         
-        legend_elements = [
-            Patch(facecolor=self.STATUS_COLORS["passed"], alpha=0.7, label="Passed (Total)"),
-            Patch(facecolor=self.SUBCAT_COLORS["clean"], label="Passed - Clean"),
-            Patch(facecolor=self.SUBCAT_COLORS["trap"], label="Passed - With Trap"),
-            Patch(facecolor=self.SUBCAT_COLORS["SDC"], label="Passed - SDC"),
-            
-            Patch(facecolor='none', label=''),  # Empty spacer
-            
-            Patch(facecolor=self.STATUS_COLORS["failed"], alpha=0.7, label="Failed (Total)"),
-            Patch(facecolor=self.SUBCAT_COLORS["clean"], label="Failed - Clean"),
-            Patch(facecolor=self.SUBCAT_COLORS["trap"], label="Failed - With Trap"),
-            Patch(facecolor=self.SUBCAT_COLORS["halt"], label="Failed - Halt"),
-            Patch(facecolor=self.SUBCAT_COLORS["comm_failure"], label="Failed - Communication Failure"),
-            Patch(facecolor=self.SUBCAT_COLORS["other"], label="Failed - Multiple Issues"),
-            
-            Patch(facecolor='none', label=''),  # Empty spacer
-            
-            Patch(facecolor=self.STATUS_COLORS["outlier"], alpha=0.7, label="Outlier (Total)"),
-            Patch(facecolor=self.SUBCAT_COLORS["trap"], label="Outlier - With Trap"),
-            Patch(facecolor=self.SUBCAT_COLORS["halt"], label="Outlier - Halt"),
-            Patch(facecolor=self.SUBCAT_COLORS["comm_failure"], label="Outlier - Communication Failure")
-        ]
-
-        ax.legend(handles=legend_elements, loc='upper right', fontsize=10, ncol=1)
-        
         ax.set_title(f'Status Distribution by Category for {benchmark_name}', fontsize=16)
         ax.set_ylabel('Number of Tests', fontsize=14)
         ax.set_xticks(index)
         ax.set_xticklabels(['Passed', 'Failed', 'Outlier'], fontsize=14)
         ax.grid(True, axis='y', linestyle='--', alpha=0.3)
-        plt.text(0.02, 0.98, f"Total Tests: {total_tests}", 
+        ax.text(0.02, 0.98, f"Total Tests: {total_tests}", 
                 transform=ax.transAxes, fontsize=12, 
                 verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-        plt.tight_layout()
         
-        output_file = os.path.join(self.output_dir, f"{benchmark_name}_status_bars.png")
-        plt.savefig(output_file, dpi=300, bbox_inches='tight')
-        print(f"Status hierarchy bar chart saved to {output_file}")
-        plt.close()
\ No newline at end of file
+        self._fig.savefig(output_file, format=format, dpi=self.dpi)
+        self._save_hash(output_file, key)
+        print(f"Status hierarchy bar chart saved to {output_file}")
\ No newline at end of file